@@ -18,7 +18,7 @@ from company_research_agent.cli.output import (
     print_success,
 )
 from company_research_agent.clients.edinet_client import EDINETClient
-from company_research_agent.core.config import EDINETConfig
+from company_research_agent.core.config import get_edinet_config
 from company_research_agent.core.exceptions import (
     EDINETAPIError,
     EDINETAuthenticationError,
@@ -45,7 +45,7 @@ async def cmd_download(args: argparse.Namespace) -> int:
     print_header("書類ダウンロード")
 
     try:
-        config = EDINETConfig()  # type: ignore[call-arg]
+        config = get_edinet_config()
     except Exception as e:
         print_error(f"設定読み込み失敗: {e}")
         return 1
@@ -150,7 +150,7 @@ async def _create_template(args: argparse.Namespace) -> int:
             # 保存
             if args.save:
                 try:
-                    filepath = generator.save_template(template, overwrite=args.force)
+                    filepath = await generator.save_template(template, overwrite=args.force)
                     print_success(f"テンプレートを保存しました: {filepath}")
                 except FileExistsError as e:
                     print_error(f"{e}")
@@ -13,7 +13,7 @@ from company_research_agent.cli.output import (
     print_info,
 )
 from company_research_agent.clients.edinet_client import EDINETClient
-from company_research_agent.core.config import EDINETConfig
+from company_research_agent.core.config import get_edinet_config
 from company_research_agent.core.exceptions import (
     EDINETAPIError,
     EDINETAuthenticationError,
@@ -31,7 +31,7 @@ async def cmd_list(args: argparse.Namespace) -> int:
     print_header("書類一覧")
 
     try:
-        config = EDINETConfig()  # type: ignore[call-arg]
+        config = get_edinet_config()
     except Exception as e:
         print_error(f"設定読み込み失敗: {e}")
         print_info("EDINET_API_KEY を .env に設定してください")
@@ -1,16 +1,14 @@
 """EDINET API client for fetching corporate disclosure documents."""
 
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
 from datetime import date
 from pathlib import Path
-from typing import Self
+from typing import Self, TypeVar
 
 import httpx
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+import orjson
 
 from company_research_agent.core.config import EDINETConfig
 from company_research_agent.core.exceptions import (
@@ -22,6 +20,12 @@ from company_research_agent.core.exceptions import (
 from company_research_agent.core.types import DocumentDownloadType
 from company_research_agent.schemas.edinet_schemas import DocumentListResponse
 
+# Exponential backoff parameters for retrying server errors (seconds)
+_RETRY_BASE_DELAY = 1.0
+_RETRY_MAX_DELAY = 60.0
+
+T = TypeVar("T")
+
 
 class EDINETClient:
     """Async client for EDINET API.
@@ -43,6 +47,9 @@ class EDINETClient:
                     )
     """
 
+    # Process-wide cache of shared instances, keyed on (api_key, base_url)
+    _shared_instances: dict[tuple[str, str], "EDINETClient"] = {}
+
     def __init__(self, config: EDINETConfig) -> None:
         """Initialize the EDINET client.
 
@@ -52,9 +59,32 @@ class EDINETClient:
         self._config = config
         self._client: httpx.AsyncClient | None = None
 
+    @classmethod
+    def shared(cls, config: EDINETConfig) -> Self:
+        """Return a process-wide shared client for the given configuration.
+
+        Reusing one instance lets batch workloads (document list + many
+        downloads) share a single connection pool and TLS session.
+
+        Args:
+            config: Configuration containing API key and settings.
+
+        Returns:
+            A cached EDINETClient instance for (api_key, base_url).
+        """
+        key = (config.api_key, config.base_url)
+        instance = cls._shared_instances.get(key)
+        if instance is None:
+            instance = cls(config)
+            cls._shared_instances[key] = instance
+        return instance
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the HTTP client.
 
+        The client enables HTTP/2 multiplexing and keep-alive pooling so
+        back-to-back API calls reuse the same TLS connection.
+
         Returns:
             The httpx AsyncClient instance.
         """
@@ -62,6 +92,13 @@ class EDINETClient:
             self._client = httpx.AsyncClient(
                 base_url=self._config.base_url,
                 params={"Subscription-Key": self._config.api_key},
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=20,
+                    max_connections=50,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(connect=5.0, read=60.0, write=10.0, pool=5.0),
             )
         return self._client
 
@@ -127,6 +164,7 @@ class EDINETClient:
                 status_code=status_code,
                 message=message,
                 endpoint=endpoint,
+                retry_after=self._parse_retry_after(response),
             )
         else:
             raise EDINETAPIError(
@@ -135,6 +173,58 @@ class EDINETClient:
                 endpoint=endpoint,
             )
 
+    @staticmethod
+    def _parse_retry_after(response: httpx.Response) -> float | None:
+        """Parse the Retry-After header as a delay in seconds.
+
+        Only the delta-seconds form is supported; the HTTP-date form is
+        rare on the EDINET API and is treated as absent.
+
+        Args:
+            response: The httpx response object.
+
+        Returns:
+            The suggested delay in seconds, or None if unavailable.
+        """
+        header = response.headers.get("Retry-After")
+        if not header:
+            return None
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            return None
+
+    async def _retry_with_backoff(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """Run an operation, retrying server errors with exponential backoff.
+
+        The delay grows as ``base * 2**attempt`` (capped) with random jitter
+        to avoid retry storms. When the server supplies a Retry-After header
+        it takes precedence, so no time is wasted sleeping longer than the
+        API asks for.
+
+        Args:
+            operation: Zero-argument coroutine factory to execute.
+
+        Returns:
+            The operation's result.
+
+        Raises:
+            EDINETServerError: If all attempts fail with server errors.
+        """
+        max_attempts = max(1, self._config.max_retries)
+        for attempt in range(max_attempts):
+            try:
+                return await operation()
+            except EDINETServerError as e:
+                if attempt + 1 >= max_attempts:
+                    raise
+                delay = min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * 2**attempt)
+                delay *= random.uniform(0.5, 1.5)
+                if e.retry_after is not None:
+                    delay = min(_RETRY_MAX_DELAY, e.retry_after)
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable")  # pragma: no cover
+
     def _check_internal_status(self, data: dict[str, object], endpoint: str) -> None:
         """Check EDINET's internal status code in JSON response.
 
@@ -223,12 +313,6 @@ class EDINETClient:
                 endpoint=endpoint,
             )
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(EDINETServerError),
-        reraise=True,
-    )
     async def get_document_list(
         self,
         target_date: date,
@@ -247,9 +331,19 @@ class EDINETClient:
         Raises:
             EDINETAuthenticationError: If API key is invalid.
             EDINETNotFoundError: If no data exists for the date.
-            EDINETServerError: If server error occurs (retried up to 3 times).
+            EDINETServerError: If server errors persist after retries.
             EDINETAPIError: For other API errors.
         """
+        return await self._retry_with_backoff(
+            lambda: self._get_document_list_once(target_date, include_details)
+        )
+
+    async def _get_document_list_once(
+        self,
+        target_date: date,
+        include_details: bool,
+    ) -> DocumentListResponse:
+        """Perform a single document list request without retry."""
         endpoint = "/documents.json"
         client = await self._get_client()
 
@@ -264,17 +358,13 @@ class EDINETClient:
 
         self._raise_for_status(response, endpoint)
 
-        data = response.json()
+        # orjson parses the (potentially large) document list noticeably
+        # faster than stdlib json and works directly on the response bytes
+        data = orjson.loads(response.content)
         self._check_internal_status(data, endpoint)
 
         return DocumentListResponse.model_validate(data)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(EDINETServerError),
-        reraise=True,
-    )
     async def download_document(
         self,
         doc_id: str,
@@ -296,36 +386,90 @@ class EDINETClient:
         Raises:
             EDINETAuthenticationError: If API key is invalid.
             EDINETNotFoundError: If document is not found.
-            EDINETServerError: If server error occurs (retried up to 3 times).
+            EDINETServerError: If server errors persist after retries.
             EDINETAPIError: For other API errors including when
                           the requested format is not available.
         """
+        return await self._retry_with_backoff(
+            lambda: self._download_document_once(doc_id, doc_type, save_path)
+        )
+
+    async def _download_document_once(
+        self,
+        doc_id: str,
+        doc_type: DocumentDownloadType,
+        save_path: Path,
+    ) -> Path:
+        """Perform a single document download without retry."""
         endpoint = f"/documents/{doc_id}"
         client = await self._get_client()
 
-        response = await client.get(
+        async with client.stream(
+            "GET",
             endpoint,
             params={"type": str(doc_type)},
             timeout=self._config.timeout_download,
-        )
+        ) as response:
+            content_type = response.headers.get("content-type", "")
+
+            # Error bodies must be read before .json() can be used
+            if response.status_code != 200 or "application/json" in content_type:
+                await response.aread()
+
+            self._raise_for_status(response, endpoint)
+
+            # Check Content-Type for error response
+            if "application/json" in content_type:
+                # Error response in JSON format
+                data = orjson.loads(response.content)
+                self._check_internal_status(data, endpoint)
+                # If no internal error but still JSON, it's an unexpected response
+                raise EDINETAPIError(
+                    status_code=0,
+                    message="Unexpected JSON response for document download",
+                    endpoint=endpoint,
+                )
+
+            # Stream binary content to file in chunks to keep memory O(chunk)
+            # and avoid blocking the event loop on large ZIP/PDF writes
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(save_path, "wb") as f:
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    await asyncio.to_thread(f.write, chunk)
 
-        self._raise_for_status(response, endpoint)
+        return save_path
 
-        # Check Content-Type for error response
-        content_type = response.headers.get("content-type", "")
-        if "application/json" in content_type:
-            # Error response in JSON format
-            data = response.json()
-            self._check_internal_status(data, endpoint)
-            # If no internal error but still JSON, it's an unexpected response
-            raise EDINETAPIError(
-                status_code=0,
-                message="Unexpected JSON response for document download",
-                endpoint=endpoint,
-            )
+    async def download_documents(
+        self,
+        specs: list[tuple[str, DocumentDownloadType, Path]],
+        concurrency: int = 8,
+    ) -> list[Path]:
+        """Download multiple documents concurrently.
 
-        # Save binary content to file
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        save_path.write_bytes(response.content)
+        Serial awaits pay one full network round trip per document; running
+        the downloads concurrently overlaps those round trips while the
+        semaphore keeps the number of in-flight requests bounded. Results
+        are returned in the same order as the input specs.
 
-        return save_path
+        Args:
+            specs: List of (doc_id, doc_type, save_path) tuples, one per
+                   document to download.
+            concurrency: Maximum number of concurrent downloads.
+
+        Returns:
+            The save paths in the same order as the input specs.
+
+        Raises:
+            ExceptionGroup: If any download fails, containing the
+                            underlying EDINET errors.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def _one(doc_id: str, doc_type: DocumentDownloadType, save_path: Path) -> Path:
+            async with sem:
+                return await self.download_document(doc_id, doc_type, save_path)
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(_one(*spec)) for spec in specs]
+
+        return [task.result() for task in tasks]
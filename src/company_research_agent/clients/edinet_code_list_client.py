@@ -8,13 +8,19 @@ from __future__ import annotations
 import csv
 import io
 import logging
+import pickle
+import shutil
+import sys
+import tempfile
+import time
+import unicodedata
 import zipfile
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import httpx
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -34,6 +40,26 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _normalize_for_search(text: str) -> str:
+    """あいまい検索用に文字列を正規化する（NFKC＋casefold）.
+
+    全角英数・半角カナの揺れと大文字小文字の差を吸収する。
+    選択肢はロード時に、クエリは検索ごとに1回だけ正規化する。
+    """
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+_LEGAL_PREFIXES = ("株式会社", "有限会社", "合同会社", "合資会社", "合名会社")
+
+
+def _strip_legal_prefix(name: str) -> str:
+    """法人格の接頭辞を除去した企業名を返す."""
+    for prefix in _LEGAL_PREFIXES:
+        if name.startswith(prefix):
+            return name[len(prefix) :]
+    return name
+
+
 class EDINETCodeListClient:
     """EDINETコードリストのダウンロード・キャッシュ・検索を行うクライアント.
 
@@ -57,6 +83,34 @@ class EDINETCodeListClient:
     CACHE_VALIDITY_DAYS = 7
     CODE_LIST_URL = "https://disclosure2dl.edinet-fsa.go.jp/searchdocument/codelist/Edinetcode.zip"
     CSV_FILENAME = "EdinetcodeDlInfo.csv"
+    INDEX_FILENAME = "companies.pkl"
+
+    # クラス全体で共有するHTTPクライアント（遅延生成）。
+    # ダウンロードごとのTLSハンドシェイク・DNS解決を省く
+    _shared_client: ClassVar[httpx.AsyncClient | None] = None
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """共有のAsyncClientを取得（遅延生成）.
+
+        Returns:
+            HTTP/2・キープアライブ接続プール付きの共有クライアント
+        """
+        if cls._shared_client is None or cls._shared_client.is_closed:
+            cls._shared_client = httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(max_keepalive_connections=10),
+                follow_redirects=True,
+            )
+        return cls._shared_client
+
+    @classmethod
+    async def aclose_shared_client(cls) -> None:
+        """共有クライアントをクローズする（シャットダウン時用）."""
+        if cls._shared_client is not None and not cls._shared_client.is_closed:
+            await cls._shared_client.aclose()
+        cls._shared_client = None
 
     def __init__(
         self,
@@ -72,9 +126,23 @@ class EDINETCodeListClient:
         self._cache_dir = cache_dir or self.CACHE_DIR
         self._cache_validity_days = cache_validity_days or self.CACHE_VALIDITY_DAYS
         self._companies: list[CompanyInfo] | None = None
+
+        # 有効と判定したキャッシュの有効期限（epoch秒）。期限内の再判定では
+        # タイムスタンプファイルの読み込みとISOパースを省く
+        self._validity_cached_until: float | None = None
         self._companies_by_edinet_code: dict[str, CompanyInfo] | None = None
         self._companies_by_sec_code: dict[str, CompanyInfo] | None = None
 
+        # あいまい検索用の選択肢リスト（_companiesと同一インデックス）。
+        # ロード時に1回だけ構築し、rapidfuzzのバッチ検索に渡す
+        self._name_choices: list[str] | None = None
+        self._kana_choices: list[str] | None = None
+        self._en_choices: list[str] | None = None
+
+        # プレフィックス型クエリ用のバケット索引
+        # （正規化済み企業名の先頭2文字 -> 企業インデックスのリスト）
+        self._prefix_buckets: dict[str, list[int]] | None = None
+
     @property
     def _csv_path(self) -> Path:
         """キャッシュされたCSVファイルのパス."""
@@ -85,12 +153,24 @@ class EDINETCodeListClient:
         """タイムスタンプファイルのパス."""
         return self._cache_dir / ".timestamp"
 
+    @property
+    def _index_path(self) -> Path:
+        """パース済みインデックス（pickle）のパス."""
+        return self._cache_dir / self.INDEX_FILENAME
+
     def _is_cache_valid(self) -> bool:
         """キャッシュが有効かどうかを判定.
 
+        一度有効と判定したら有効期限までは結果をメモ化し、
+        呼び出しごとのファイル読み込み・ISOパースを省く
+        （プロセス内でキャッシュが期限前に無効化されることはないため）。
+
         Returns:
             キャッシュが存在し、有効期限内であればTrue
         """
+        if self._validity_cached_until is not None and time.time() < self._validity_cached_until:
+            return True
+
         if not self._csv_path.exists():
             return False
 
@@ -99,9 +179,16 @@ class EDINETCodeListClient:
 
         try:
             timestamp_str = self._timestamp_path.read_text().strip()
-            timestamp = datetime.fromisoformat(timestamp_str)
-            expiry = timestamp + timedelta(days=self._cache_validity_days)
-            return datetime.now() < expiry
+            # 現行形式はepoch秒。旧形式のISO文字列も移行措置として読める
+            try:
+                timestamp = float(timestamp_str)
+            except ValueError:
+                timestamp = datetime.fromisoformat(timestamp_str).timestamp()
+            expiry = timestamp + self._cache_validity_days * 86400
+            if time.time() < expiry:
+                self._validity_cached_until = expiry
+                return True
+            return False
         except (ValueError, OSError) as e:
             logger.warning(f"Failed to read cache timestamp: {e}")
             return False
@@ -121,32 +208,33 @@ class EDINETCodeListClient:
         logger.info(f"Downloading EDINET code list from {self.CODE_LIST_URL}")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.CODE_LIST_URL,
-                    timeout=60.0,
-                    follow_redirects=True,
-                )
-                response.raise_for_status()
-
-            # ZIPを展開
             self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-            with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-                # CSVファイルを探す
-                csv_files = [n for n in zf.namelist() if n.endswith(".csv")]
-                if not csv_files:
-                    raise CodeListDownloadError(
-                        message="No CSV file found in ZIP",
-                        url=self.CODE_LIST_URL,
-                    )
-
-                # 最初のCSVファイルを展開
-                csv_content = zf.read(csv_files[0])
-                self._csv_path.write_bytes(csv_content)
-
-            # タイムスタンプを記録
-            self._timestamp_path.write_text(datetime.now().isoformat())
+            # ZIP全体をresponse.contentとしてメモリに載せず、スプール
+            # （小さければメモリ、大きければ一時ファイル）へストリーミングする
+            with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
+                client = self._get_client()
+                async with client.stream("GET", self.CODE_LIST_URL) as response:
+                    response.raise_for_status()
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        spool.write(chunk)
+
+                spool.seek(0)
+                with zipfile.ZipFile(spool) as zf:
+                    # CSVファイルを探す
+                    csv_files = [n for n in zf.namelist() if n.endswith(".csv")]
+                    if not csv_files:
+                        raise CodeListDownloadError(
+                            message="No CSV file found in ZIP",
+                            url=self.CODE_LIST_URL,
+                        )
+
+                    # 最初のCSVファイルをチャンク単位で展開（全量読み込みを避ける）
+                    with zf.open(csv_files[0]) as src, self._csv_path.open("wb") as dst:
+                        shutil.copyfileobj(src, dst, length=65536)
+
+            # タイムスタンプを記録（epoch秒。判定時のISOパースを不要にする）
+            self._timestamp_path.write_text(str(int(time.time())))
 
             logger.info(f"EDINET code list saved to {self._csv_path}")
 
@@ -166,34 +254,77 @@ class EDINETCodeListClient:
                 url=self.CODE_LIST_URL,
             ) from e
 
-    def _load_from_cache(self) -> None:
-        """キャッシュからコードリストを読み込む."""
-        if self._companies is not None:
-            return
+    def _load_index(self) -> list[CompanyInfo] | None:
+        """パース済みインデックスを読み込む（CSVより新しい場合のみ）.
+
+        Returns:
+            企業リスト。インデックスがない・古い・壊れている場合はNone。
+        """
+        try:
+            if not self._index_path.exists():
+                return None
+            if self._index_path.stat().st_mtime < self._csv_path.stat().st_mtime:
+                return None
+            with self._index_path.open("rb") as f:
+                companies: list[CompanyInfo] = pickle.load(f)
+            logger.debug(f"Loaded parsed index from {self._index_path}")
+            return companies
+        except Exception as e:
+            logger.warning(f"Failed to load parsed index: {e}")
+            return None
 
+    def _save_index(self, companies: list[CompanyInfo]) -> None:
+        """パース済みインデックスをCSVの隣に保存する."""
+        try:
+            with self._index_path.open("wb") as f:
+                pickle.dump(companies, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            logger.warning(f"Failed to save parsed index: {e}")
+
+    def _parse_csv(self) -> list[CompanyInfo]:
+        """キャッシュされたCSVをパースして企業リストを返す."""
         logger.debug(f"Loading EDINET code list from {self._csv_path}")
 
         companies: list[CompanyInfo] = []
-        by_edinet_code: dict[str, CompanyInfo] = {}
-        by_sec_code: dict[str, CompanyInfo] = {}
 
-        # CSVはShift_JISエンコーディング
-        with self._csv_path.open("r", encoding="cp932") as f:
+        # CSVはShift_JISエンコーディング。逐次デコードとreadlineの
+        # オーバーヘッドを避けるため、全体を読み込んで1回で一括デコードする
+        text = self._csv_path.read_bytes().decode("cp932")
+        with io.StringIO(text) as f:
             # 最初の行はヘッダー説明なのでスキップ
             next(f, None)
-            reader = csv.DictReader(f)
+
+            # DictReaderの行ごとの辞書生成を避け、ヘッダーから必要な列の
+            # インデックスを1回だけ解決してタプルのまま読む
+            reader = csv.reader(f)
+            header = next(reader, None) or []
+            columns = {name: i for i, name in enumerate(header)}
+            idx_edinet = columns.get("ＥＤＩＮＥＴコード", -1)
+            idx_sec = columns.get("証券コード", -1)
+            idx_name = columns.get("提出者名", -1)
+            idx_kana = columns.get("提出者名（カナ）", -1)
+            idx_en = columns.get("提出者名（英字）", -1)
+            idx_listing = columns.get("上場区分", -1)
+            idx_industry = columns.get("提出者業種", -1)
+
+            def cell(row: list[str], index: int) -> str:
+                return row[index].strip() if 0 <= index < len(row) else ""
 
             for row in reader:
-                edinet_code = row.get("ＥＤＩＮＥＴコード", "").strip()
+                edinet_code = cell(row, idx_edinet)
                 if not edinet_code:
                     continue
 
-                sec_code = row.get("証券コード", "").strip() or None
-                company_name = row.get("提出者名", "").strip()
-                company_name_kana = row.get("提出者名（カナ）", "").strip() or None
-                company_name_en = row.get("提出者名（英字）", "").strip() or None
-                listing_code = row.get("上場区分", "").strip() or None
-                industry_code = row.get("提出者業種", "").strip() or None
+                sec_code = cell(row, idx_sec) or None
+                company_name = cell(row, idx_name)
+                company_name_kana = cell(row, idx_kana) or None
+                company_name_en = cell(row, idx_en) or None
+                # 上場区分・業種は少数のカテゴリ値が全行で繰り返されるため、
+                # internして文字列オブジェクトを共有する
+                listing_value = cell(row, idx_listing)
+                listing_code = sys.intern(listing_value) if listing_value else None
+                industry_value = cell(row, idx_industry)
+                industry_code = sys.intern(industry_value) if industry_value else None
 
                 company = CompanyInfo(
                     edinet_code=edinet_code,
@@ -206,14 +337,59 @@ class EDINETCodeListClient:
                 )
 
                 companies.append(company)
-                by_edinet_code[edinet_code] = company
-                if sec_code:
-                    by_sec_code[sec_code] = company
+
+        return companies
+
+    def _load_from_cache(self) -> None:
+        """キャッシュからコードリストを読み込む.
+
+        2回目以降のプロセス起動ではCSVパースとスキーマ検証を省略するため、
+        パース済みの企業リストをpickleでCSVの隣に永続化しておき、
+        CSVより新しければそちらを読む。
+        """
+        if self._companies is not None:
+            return
+
+        companies = self._load_index()
+        if companies is None:
+            companies = self._parse_csv()
+            self._save_index(companies)
 
         self._companies = companies
-        self._companies_by_edinet_code = by_edinet_code
+        self._companies_by_edinet_code = {c.edinet_code: c for c in companies}
+
+        # 5桁の正式形式と末尾0を除いた4桁形式の両方をキーとして登録し、
+        # 検索時の正規化（ゼロ埋め・分岐）を不要にする
+        by_sec_code: dict[str, CompanyInfo] = {}
+        for c in companies:
+            if not c.sec_code:
+                continue
+            by_sec_code[c.sec_code] = c
+            if c.sec_code.endswith("0"):
+                by_sec_code.setdefault(c.sec_code[:-1], c)
         self._companies_by_sec_code = by_sec_code
 
+        # あいまい検索用の選択肢（カナ・英語名がない企業は空文字でスコア0になる）。
+        # クエリごとの正規化コストを避けるため、ここで1回だけ正規化しておく
+        self._name_choices = [_normalize_for_search(c.company_name) for c in companies]
+        self._kana_choices = [_normalize_for_search(c.company_name_kana or "") for c in companies]
+        self._en_choices = [_normalize_for_search(c.company_name_en or "") for c in companies]
+
+        # プレフィックス型クエリ（ユーザーが先頭から入力するケース）向けに、
+        # 正規化済み企業名の先頭2文字で企業インデックスをバケット化する。
+        # 「株式会社トヨタ〜」のような形式も引けるよう、法人格除去後の
+        # 先頭2文字でも併せて登録する
+        prefix_buckets: dict[str, list[int]] = {}
+        for i, (company, normalized) in enumerate(zip(companies, self._name_choices, strict=True)):
+            keys = {normalized[:2]}
+            stripped = _strip_legal_prefix(company.company_name)
+            if stripped != company.company_name:
+                keys.add(_normalize_for_search(stripped)[:2])
+            for key in keys:
+                if key:
+                    prefix_buckets.setdefault(key, []).append(i)
+        self._prefix_buckets = prefix_buckets
+
         logger.info(f"Loaded {len(companies)} companies from EDINET code list")
 
     async def ensure_code_list(self, force_refresh: bool = False) -> Path:
@@ -271,9 +447,7 @@ class EDINETCodeListClient:
 
         # 証券コードで直接検索
         if query.isdigit() and len(query) in (4, 5):
-            # 4桁の場合は末尾に0を付加して5桁に（EDINETの証券コード形式）
-            sec_code = query + "0" if len(query) == 4 else query
-            company = await self.get_by_sec_code(sec_code)
+            company = await self.get_by_sec_code(query)
             if company:
                 return [
                     CompanyCandidate(
@@ -283,42 +457,20 @@ class EDINETCodeListClient:
                     )
                 ]
 
-        # あいまい検索
-        candidates: list[CompanyCandidate] = []
+        # あいまい検索。同スコア帯の並べ替え（プレフィックス一致など）が
+        # 境界で欠けないよう、返却数の数倍を候補プールとする
+        candidate_pool = max(limit * 5, 50)
+        normalized_query = _normalize_for_search(query)
 
-        for company in self._companies:
-            best_score = 0.0
-            best_field = "company_name"
-
-            # 企業名との類似度
-            score = fuzz.partial_ratio(query, company.company_name)
-            if score > best_score:
-                best_score = score
-                best_field = "company_name"
-
-            # カナ名との類似度
-            if company.company_name_kana:
-                score = fuzz.partial_ratio(query, company.company_name_kana)
-                if score > best_score:
-                    best_score = score
-                    best_field = "company_name_kana"
-
-            # 英語名との類似度
-            if company.company_name_en:
-                score = fuzz.partial_ratio(query.upper(), company.company_name_en.upper())
-                if score > best_score:
-                    best_score = score
-                    best_field = "company_name_en"
-
-            # しきい値以上のスコアのみ追加
-            if best_score >= 50:
-                candidates.append(
-                    CompanyCandidate(
-                        company=company,
-                        similarity_score=best_score,
-                        match_field=best_field,
-                    )
-                )
+        # プレフィックス型クエリでは先頭2文字のバケット内だけをスコアリングし、
+        # 候補が十分集まらない場合のみ全件スキャンへフォールバックする
+        candidates: list[CompanyCandidate] = []
+        if len(normalized_query) >= 2 and self._prefix_buckets:
+            subset = self._prefix_buckets.get(normalized_query[:2])
+            if subset:
+                candidates = self._score_candidates(normalized_query, candidate_pool, subset)
+        if len(candidates) < limit:
+            candidates = self._score_candidates(normalized_query, candidate_pool, None)
 
         # スコア降順でソート（同スコアの場合は追加条件で優先度を決定）
         # 優先順位:
@@ -336,18 +488,10 @@ class EDINETCodeListClient:
             "保険",
             "製作所",
         )
-        legal_prefixes = ("株式会社", "有限会社", "合同会社", "合資会社", "合名会社")
-
-        def normalize_name(name: str) -> str:
-            """法人格を除去した企業名を返す."""
-            for prefix in legal_prefixes:
-                if name.startswith(prefix):
-                    return name[len(prefix) :]
-            return name
 
         def sort_key(c: CompanyCandidate) -> tuple[float, int, int, int]:
             name = c.company.company_name
-            normalized = normalize_name(name)
+            normalized = _strip_legal_prefix(name)
             is_prefix_match = 1 if (name.startswith(query) or normalized.startswith(query)) else 0
             is_listed = 1 if c.company.sec_code else 0
             has_major_keyword = 1 if any(kw in name for kw in major_industry_keywords) else 0
@@ -356,6 +500,63 @@ class EDINETCodeListClient:
         candidates.sort(key=sort_key, reverse=True)
         return candidates[:limit]
 
+    def _score_candidates(
+        self,
+        normalized_query: str,
+        candidate_pool: int,
+        indices: list[int] | None,
+    ) -> list[CompanyCandidate]:
+        """フィールドごとのあいまい一致スコアリングで候補を生成する.
+
+        Pythonループで1社ずつスコアリングする代わりに、rapidfuzzの
+        バッチAPIでフィールドごとに一括スコアリングする（スコア計算は
+        C++実装内で完結し、しきい値未満はその場で除外される）。
+        limit指定によりrapidfuzz内部の有界top-k選択が働き、
+        しきい値超の全件分の候補オブジェクト生成を避ける。
+
+        Args:
+            normalized_query: 正規化済みの検索クエリ
+            candidate_pool: フィールドごとに取り出す候補数の上限
+            indices: スコアリング対象の企業インデックス。Noneで全社。
+
+        Returns:
+            類似度スコア付きの企業候補リスト（未ソート）
+        """
+        companies = self._companies or []
+        field_searches: tuple[tuple[str, list[str]], ...] = (
+            ("company_name", self._name_choices or []),
+            ("company_name_kana", self._kana_choices or []),
+            ("company_name_en", self._en_choices or []),
+        )
+
+        # 企業インデックス -> (ベストスコア, マッチフィールド)。
+        # フィールドの評価順と「より高いスコアのみ更新」は従来ループと同一
+        best_matches: dict[int, tuple[float, str]] = {}
+        for field, choices in field_searches:
+            if indices is not None:
+                choices = [choices[i] for i in indices]
+            matches = process.extract(
+                normalized_query,
+                choices,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=50,
+                limit=candidate_pool,
+            )
+            for _choice, score, index in matches:
+                company_index = indices[index] if indices is not None else index
+                current = best_matches.get(company_index)
+                if current is None or score > current[0]:
+                    best_matches[company_index] = (score, field)
+
+        return [
+            CompanyCandidate(
+                company=companies[index],
+                similarity_score=score,
+                match_field=field,
+            )
+            for index, (score, field) in best_matches.items()
+        ]
+
     async def get_by_edinet_code(self, code: str) -> CompanyInfo | None:
         """EDINETコードで企業を検索.
 
@@ -376,7 +577,7 @@ class EDINETCodeListClient:
         """証券コードで企業を検索.
 
         Args:
-            code: 証券コード（5桁、例: 72030）
+            code: 証券コード（5桁、または末尾0を省いた4桁。例: 72030 / 7203）
 
         Returns:
             企業情報。見つからない場合はNone。
@@ -386,6 +587,5 @@ class EDINETCodeListClient:
         if self._companies_by_sec_code is None:
             return None
 
-        # 4桁の場合は末尾に0を付加して5桁に（EDINETの証券コード形式）
-        normalized_code = code + "0" if len(code) == 4 else code
-        return self._companies_by_sec_code.get(normalized_code)
+        # ロード時に4桁・5桁の両形式をキー登録済みのため、単一のgetで引ける
+        return self._companies_by_sec_code.get(code)
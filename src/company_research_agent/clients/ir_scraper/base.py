@@ -153,13 +153,15 @@ class BaseIRScraper:
         retry=retry_if_exception_type(IRPageAccessError),
         reraise=True,
     )
-    async def fetch_page(self, url: str) -> str:
+    async def fetch_page(self, url: str, max_chars: int | None = None) -> str:
         """ページのHTMLを取得する.
 
         JavaScriptを実行した後のレンダリング済みHTMLを取得する。
 
         Args:
             url: 取得するページのURL
+            max_chars: HTMLの最大文字数。指定時は先頭max_chars文字に
+                切り詰めて返し、巨大ページを下流に持ち回らない。
 
         Returns:
             レンダリング済みのHTML文字列
@@ -195,6 +197,8 @@ class BaseIRScraper:
 
             html: str = await page.content()
             logger.debug(f"Fetched page: {url} ({len(html)} bytes)")
+            if max_chars is not None and len(html) > max_chars:
+                html = html[:max_chars]
             return html
 
         except IRPageAccessError:
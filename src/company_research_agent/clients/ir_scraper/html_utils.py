@@ -0,0 +1,65 @@
+"""ir_scraper共通のHTMLパースヘルパー."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
+
+from bs4 import BeautifulSoup
+
+
+@lru_cache(maxsize=16)
+def parse_soup(html: str) -> BeautifulSoup:
+    """同一HTML文字列の再パースを避けてBeautifulSoupツリーを返す.
+
+    同じページのHTMLを複数の解析処理（リンク発見・ページ解析など）で
+    使い回す際に、パースコストを1回に抑える。
+
+    注意: 返されるツリーはキャッシュされた共有インスタンス。利用側は
+    リンク・見出し・テキストの抽出のみを行い、script/style等の不要タグの
+    decompose以外の破壊的変更を加えないこと。
+
+    Args:
+        html: HTML文字列
+
+    Returns:
+        パース済みのBeautifulSoupツリー
+    """
+    return BeautifulSoup(html, "lxml")
+
+
+@lru_cache(maxsize=256)
+def _base_parts(url: str) -> tuple[str, str, str]:
+    """ベースURLのscheme/netloc/ディレクトリパスをキャッシュ付きで返す."""
+    parts = urlsplit(url)
+    path = parts.path
+    base_dir = path[: path.rfind("/") + 1] or "/"
+    return parts.scheme, parts.netloc, base_dir
+
+
+def fast_urljoin(base_url: str, href: str) -> str:
+    """典型的なhref形式を再パースなしで解決するurljoinの高速版.
+
+    同一ベースURLに対して多数のリンクを解決する場合、urljoinは
+    呼び出しごとに両URLを再パースする。絶対URL・ルート相対パス・
+    単純な相対パスはキャッシュ済みのscheme/netloc/ディレクトリから
+    直接組み立て、それ以外（..や特殊形式）のみurljoinに
+    フォールバックする。
+
+    Args:
+        base_url: ベースURL
+        href: 解決対象のリンク
+
+    Returns:
+        絶対URL
+    """
+    if href.startswith(("http://", "https://")):
+        return href
+    scheme, netloc, base_dir = _base_parts(base_url)
+    if href.startswith("//"):
+        return f"{scheme}:{href}"
+    if href.startswith("/"):
+        return f"{scheme}://{netloc}{href}"
+    if href and ".." not in href and ":" not in href and not href.startswith(("?", "#")):
+        return f"{scheme}://{netloc}{base_dir}{href}"
+    return urljoin(base_url, href)
@@ -6,21 +6,34 @@ import logging
 import re
 from datetime import date, datetime
 from typing import TYPE_CHECKING
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 from bs4 import BeautifulSoup
+from lxml import html as lxml_html
 
+from company_research_agent.clients.ir_scraper.html_utils import fast_urljoin
 from company_research_agent.schemas.ir_schemas import (
     ExtractedLinksResponse,
     IRDocument,
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from company_research_agent.clients.ir_scraper.base import BaseIRScraper
     from company_research_agent.llm.provider import LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# IRページらしいURLの一般的なパターン（モジュール読み込み時に1回だけコンパイル）
+_IR_URL_PATTERNS = (
+    re.compile(r"/ir/?"),
+    re.compile(r"/investor/?"),
+    re.compile(r"/investors/?"),
+    re.compile(r"/stockholders/?"),
+    re.compile(r"investor[-_]?relations"),
+)
+
 # LLMへのプロンプト
 EXPLORE_IR_PAGE_PROMPT = """あなたは企業のIRページを解析する専門家です。
 以下のウェブページから、IR資料やIRニュースへのリンクを抽出し、正確に分類してください。
@@ -163,7 +176,7 @@ class LLMExplorer:
             documents: list[IRDocument] = []
             for link in response.links:
                 # 相対URLを絶対URLに変換
-                absolute_url = urljoin(url, link.url)
+                absolute_url = fast_urljoin(url, link.url)
 
                 # 公開日を解析
                 published_date: date | None = None
@@ -200,44 +213,43 @@ class LLMExplorer:
         Returns:
             マークダウン形式の文字列
         """
-        soup = BeautifulSoup(html, "html.parser")
+        # 抽出のみの処理のためbs4のPythonツリーを経由せずlxmlのC APIで走査する
+        tree = lxml_html.fromstring(html)
+
+        # head配下を走査対象から外すため、bodyサブツリーのみを対象にする
+        body = tree.find("body")
+        root = body if body is not None else tree
 
         # 不要な要素を削除
-        for tag in soup(["script", "style", "nav", "footer", "header", "noscript"]):
-            tag.decompose()
+        for element in list(root.iter("script", "style", "nav", "footer", "header", "noscript")):
+            parent = element.getparent()
+            if parent is not None:
+                parent.remove(element)
 
         # テキストを抽出しつつリンクを保持
-        markdown_parts: list[str] = []
-
-        for element in soup.find_all(["a", "p", "h1", "h2", "h3", "h4", "li", "td", "div"]):
-            if element.name == "a":
-                href = element.get("href", "")
-                text = element.get_text(strip=True)
-                if href and text:
-                    # PDFリンクを強調
-                    if str(href).lower().endswith(".pdf"):
-                        markdown_parts.append(f"[PDF] [{text}]({href})")
-                    else:
-                        markdown_parts.append(f"[{text}]({href})")
-            elif element.name in ["h1", "h2", "h3", "h4"]:
-                text = element.get_text(strip=True)
-                if text:
-                    level = int(element.name[1])
-                    markdown_parts.append(f"{'#' * level} {text}")
-            else:
-                text = element.get_text(strip=True)
-                if text and len(text) > 10:  # 短すぎるテキストは除外
-                    markdown_parts.append(text)
-
-        # 重複を削除しつつ順序を保持
-        seen: set[str] = set()
-        unique_parts: list[str] = []
-        for part in markdown_parts:
-            if part not in seen:
-                seen.add(part)
-                unique_parts.append(part)
-
-        return "\n\n".join(unique_parts)
+        def _emit_parts() -> Iterator[str]:
+            for element in root.iter("a", "p", "h1", "h2", "h3", "h4", "li", "td", "div"):
+                if element.tag == "a":
+                    href = element.get("href", "")
+                    text = element.text_content().strip()
+                    if href and text:
+                        # PDFリンクを強調
+                        if href.lower().endswith(".pdf"):
+                            yield f"[PDF] [{text}]({href})"
+                        else:
+                            yield f"[{text}]({href})"
+                elif element.tag in ("h1", "h2", "h3", "h4"):
+                    text = element.text_content().strip()
+                    if text:
+                        level = int(element.tag[1])
+                        yield f"{'#' * level} {text}"
+                else:
+                    text = element.text_content().strip()
+                    if text and len(text) > 10:  # 短すぎるテキストは除外
+                        yield text
+
+        # 中間リストを作らず、順序を保った重複排除と結合を1パスで行う
+        return "\n\n".join(dict.fromkeys(_emit_parts()))
 
     async def find_ir_page_url(
         self,
@@ -255,16 +267,7 @@ class LLMExplorer:
         """
         try:
             html = await scraper.fetch_page(company_url)
-            soup = BeautifulSoup(html, "html.parser")
-
-            # IRページへのリンクを探す（一般的なパターン）
-            ir_patterns = [
-                r"/ir/?",
-                r"/investor/?",
-                r"/investors/?",
-                r"/stockholders/?",
-                r"investor[-_]?relations",
-            ]
+            soup = BeautifulSoup(html, "lxml")
 
             for link in soup.find_all("a", href=True):
                 href_attr = link.get("href", "")
@@ -273,13 +276,13 @@ class LLMExplorer:
                 text = link.get_text(strip=True).lower()
 
                 # URLパターンでマッチ
-                for pattern in ir_patterns:
-                    if re.search(pattern, href):
-                        return urljoin(company_url, href_str)
+                for pattern in _IR_URL_PATTERNS:
+                    if pattern.search(href):
+                        return fast_urljoin(company_url, href_str)
 
                 # テキストでマッチ
                 if any(keyword in text for keyword in ["ir", "投資家", "株主", "investor"]):
-                    return urljoin(company_url, href_str)
+                    return fast_urljoin(company_url, href_str)
 
             return None
 
@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 
 import yaml
 from bs4 import BeautifulSoup
 
+from company_research_agent.clients.ir_scraper.html_utils import fast_urljoin, parse_soup
 from company_research_agent.core.config import get_config
 from company_research_agent.prompts.ir_template import (
     IR_PAGE_ANALYSIS_PROMPT,
@@ -30,6 +33,88 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# PDF・画像リンクの除外パターン（モジュール読み込み時に1回だけコンパイル）
+_ASSET_URL_RE = re.compile(r"\.(pdf|png|jpg|jpeg|gif)$", re.I)
+
+# ファイル名に使用できない文字の除去パターン
+_FILENAME_UNSAFE_RE = re.compile(r"[^\w\-]")
+
+# LLMに渡す整形済みHTMLの最大文字数
+_MAX_CLEAN_HTML_CHARS = 30000
+
+# サブページ発見で使用するIR関連キーワード
+_IR_KEYWORDS = (
+    "決算",
+    "業績",
+    "財務",
+    "earnings",
+    "financial",
+    "ニュース",
+    "news",
+    "press",
+    "適時開示",
+    "disclosure",
+    "有価証券",
+    "securities",
+    "ir資料",
+    "ir library",
+    "資料室",
+)
+
+
+@lru_cache(maxsize=16)
+def _extract_subpages_and_clean_html(html: str, base_url: str) -> tuple[tuple[str, ...], str]:
+    """1回のパースでサブページURL一覧とLLM入力用の整形済みHTMLを生成する.
+
+    generate_templateではサブページ発見とページ解析が同一HTMLを扱うため、
+    パース・リンク走査・整形を融合して1パスに抑える。
+
+    Args:
+        html: HTMLコンテンツ
+        base_url: ベースURL
+
+    Returns:
+        (サブページURLのタプル（最大10件）, 切り詰め済みHTML)
+    """
+    soup = parse_soup(html)
+
+    # IR関連のリンクを抽出（最大10件に達した時点でDOM走査を打ち切る）
+    subpages: set[str] = set()
+    base_netloc = urlparse(base_url).netloc
+
+    for link in soup.find_all("a", href=True):
+        href = str(link.get("href", ""))
+        text = link.get_text(strip=True).lower()
+
+        if not any(kw in href.lower() or kw in text for kw in _IR_KEYWORDS):
+            continue
+
+        # 相対URLを絶対URLに変換
+        absolute_url = fast_urljoin(base_url, href)
+
+        # 重複・外部ドメイン・PDFや画像は除外
+        if (
+            absolute_url in subpages
+            or urlparse(absolute_url).netloc != base_netloc
+            or _ASSET_URL_RE.search(absolute_url)
+        ):
+            continue
+
+        subpages.add(absolute_url)
+        if len(subpages) >= 10:
+            break
+
+    # scriptとstyleを除去
+    for tag in soup(["script", "style", "noscript"]):
+        tag.decompose()
+
+    # HTMLを文字列に変換して切り詰め
+    clean_html = str(soup)
+    if len(clean_html) > _MAX_CLEAN_HTML_CHARS:
+        clean_html = clean_html[:_MAX_CLEAN_HTML_CHARS] + "\n<!-- truncated -->"
+
+    return tuple(subpages), clean_html
+
 
 class IRTemplateGenerator:
     """LLMを使用してIRテンプレートを自動生成するクラス.
@@ -45,7 +130,7 @@ class IRTemplateGenerator:
         ...         company_name="トヨタ自動車",
         ...         ir_url="https://global.toyota/jp/ir/",
         ...     )
-        ...     generator.save_template(template)
+        ...     await generator.save_template(template)
     """
 
     def __init__(
@@ -62,6 +147,11 @@ class IRTemplateGenerator:
         self._config = get_config()
         self._llm_provider = llm_provider
 
+        # 同一入力に対するセクション重複排除の再計算を避けるキャッシュ
+        self._dedup_cache: dict[
+            tuple[tuple[tuple[str, str, float], ...], str], dict[str, DiscoveredSection]
+        ] = {}
+
         if templates_dir is None:
             self._templates_dir = Path(__file__).parents[4] / "config" / "ir_templates"
         else:
@@ -121,7 +211,7 @@ class IRTemplateGenerator:
                 html = await page.content()
                 await browser.close()
 
-                soup = BeautifulSoup(html, "html.parser")
+                soup = BeautifulSoup(html, "lxml")
 
                 # Google検索結果からURLを抽出
                 ir_urls: list[tuple[str, int]] = []  # (url, score)
@@ -237,20 +327,41 @@ class IRTemplateGenerator:
         logger.info(f"Discovered {len(subpages)} subpages")
 
         # 3. 各ページを解析してセクション設定を生成
-        all_sections: list[DiscoveredSection] = []
+        # サブページのHTMLを並行取得（リモートサイトへの負荷を抑えるため同時5件まで）
+        semaphore = asyncio.Semaphore(5)
+
+        async def _bounded_fetch(subpage_url: str) -> tuple[str, str] | None:
+            async with semaphore:
+                try:
+                    # サブページは解析で切り詰める分しか使わないため取得時点で制限する
+                    subpage_html = await scraper.fetch_page(
+                        subpage_url, max_chars=_MAX_CLEAN_HTML_CHARS
+                    )
+                    return subpage_url, subpage_html
+                except Exception as e:
+                    logger.warning(f"Failed to fetch subpage {subpage_url}: {e}")
+                    return None
 
-        # メインページを解析
-        main_sections = await self._analyze_page(ir_url, html, company_name)
-        all_sections.extend(main_sections)
+        fetched = await asyncio.gather(*(_bounded_fetch(u) for u in subpages))
 
-        # サブページを解析
-        for subpage_url in subpages:
-            try:
-                subpage_html = await scraper.fetch_page(subpage_url)
-                sections = await self._analyze_page(subpage_url, subpage_html, company_name)
-                all_sections.extend(sections)
-            except Exception as e:
-                logger.warning(f"Failed to analyze subpage {subpage_url}: {e}")
+        page_inputs: list[tuple[str, str]] = [(ir_url, html)]
+        page_inputs.extend(pair for pair in fetched if pair is not None)
+
+        # LLM呼び出しは互いに独立なためgatherで並行実行する
+        results = await asyncio.gather(
+            *(
+                self._analyze_page(page_url, page_html, company_name)
+                for page_url, page_html in page_inputs
+            ),
+            return_exceptions=True,
+        )
+
+        all_sections: list[DiscoveredSection] = [
+            section
+            for result in results
+            if not isinstance(result, BaseException)
+            for section in result
+        ]
 
         # 4. 重複を除去し、最も確信度の高いセクションを選択
         sections_by_category = self._deduplicate_sections(all_sections, ir_url)
@@ -302,47 +413,8 @@ class IRTemplateGenerator:
         Returns:
             発見されたサブページURLのリスト
         """
-        # HTMLを簡略化（主にナビゲーション部分を抽出）
-        soup = BeautifulSoup(html, "html.parser")
-
-        # IR関連のリンクを正規表現で抽出
-        subpages: set[str] = set()
-
-        # リンクをすべて抽出
-        for link in soup.find_all("a", href=True):
-            href = str(link.get("href", ""))
-            text = link.get_text(strip=True).lower()
-
-            # IR関連のキーワードをチェック
-            ir_keywords = [
-                "決算",
-                "業績",
-                "財務",
-                "earnings",
-                "financial",
-                "ニュース",
-                "news",
-                "press",
-                "適時開示",
-                "disclosure",
-                "有価証券",
-                "securities",
-                "ir資料",
-                "ir library",
-                "資料室",
-            ]
-
-            if any(kw in href.lower() or kw in text for kw in ir_keywords):
-                # 相対URLを絶対URLに変換
-                absolute_url = urljoin(base_url, href)
-
-                # 同一ドメインのみ
-                if urlparse(absolute_url).netloc == urlparse(base_url).netloc:
-                    # PDFや画像は除外
-                    if not re.search(r"\.(pdf|png|jpg|jpeg|gif)$", absolute_url, re.I):
-                        subpages.add(absolute_url)
-
-        return list(subpages)[:10]  # 最大10ページ
+        subpages, _ = _extract_subpages_and_clean_html(html, base_url)
+        return list(subpages)
 
     async def _analyze_page(
         self,
@@ -360,18 +432,8 @@ class IRTemplateGenerator:
         Returns:
             発見されたセクションのリスト
         """
-        # HTMLを適切なサイズに切り詰め
-        soup = BeautifulSoup(html, "html.parser")
-
-        # scriptとstyleを除去
-        for tag in soup(["script", "style", "noscript"]):
-            tag.decompose()
-
-        # HTMLを文字列に変換して切り詰め
-        clean_html = str(soup)
-        max_length = 30000
-        if len(clean_html) > max_length:
-            clean_html = clean_html[:max_length] + "\n<!-- truncated -->"
+        # サブページ発見と同一HTMLを扱うため、抽出・整形結果を共有する
+        _, clean_html = _extract_subpages_and_clean_html(html, url)
 
         # LLMでページ構造を解析
         prompt = IR_PAGE_ANALYSIS_PROMPT.format(
@@ -443,25 +505,36 @@ class IRTemplateGenerator:
         Returns:
             カテゴリをキーとしたセクションの辞書
         """
+        # 同一セクション集合での再実行（検証時の再デデュープ等）をキャッシュで省く
+        cache_key = (
+            tuple((s.category, s.url, s.confidence) for s in sections),
+            base_url,
+        )
+        cached = self._dedup_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # 1パスでカテゴリごとの最高信頼度セクションを選択
         result: dict[str, DiscoveredSection] = {}
 
         for section in sections:
-            category = section.category
-
-            if category not in result:
-                result[category] = section
-            elif section.confidence > result[category].confidence:
-                result[category] = section
+            current = result.get(section.category)
+            if current is None or section.confidence > current.confidence:
+                result[section.category] = section
 
+        self._dedup_cache[cache_key] = result
         return result
 
-    def save_template(
+    async def save_template(
         self,
         template: IRTemplateConfig,
         overwrite: bool = False,
     ) -> Path:
         """テンプレートをYAMLファイルとして保存する.
 
+        ディスク書き込みでイベントループを塞がないよう、
+        シリアライズと書き込みはワーカースレッドで実行する。
+
         Args:
             template: 保存するテンプレート
             overwrite: 既存ファイルを上書きするか
@@ -473,7 +546,7 @@ class IRTemplateGenerator:
             FileExistsError: overwrite=Falseで既存ファイルがある場合
         """
         # ファイル名を生成（証券コード_企業名.yaml）
-        company_name_safe = re.sub(r"[^\w\-]", "", template.company.name.lower())
+        company_name_safe = _FILENAME_UNSAFE_RE.sub("", template.company.name.lower())
         filename = f"{template.company.sec_code}_{company_name_safe}.yaml"
         filepath = self._templates_dir / filename
 
@@ -514,17 +587,20 @@ class IRTemplateGenerator:
             },
         }
 
-        # ファイルに書き込み
-        with open(filepath, "w", encoding="utf-8") as f:
-            # コメントを追加
-            f.write(f"# {template.company.name} IRテンプレート\n")
-            yaml.dump(
+        # コメント行を含めた内容を組み立てて1回で書き込む
+        def _dump() -> None:
+            # libyamlのCダンパーでシリアライズを高速化
+            body = yaml.dump(
                 template_dict,
-                f,
+                Dumper=yaml.CSafeDumper,
                 allow_unicode=True,
                 default_flow_style=False,
                 sort_keys=False,
             )
+            content = f"# {template.company.name} IRテンプレート\n{body}"
+            filepath.write_text(content, encoding="utf-8")
+
+        await asyncio.to_thread(_dump)
 
         logger.info(f"Saved template to {filepath}")
         return filepath
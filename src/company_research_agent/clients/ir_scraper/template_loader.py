@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import logging
 import re
+import time
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 from urllib.parse import urljoin
 
 import yaml
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
+try:
+    # libyamlのCローダーでパースを高速化（未ビルド環境では純Python実装を使用）
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+from company_research_agent.clients.ir_scraper.html_utils import fast_urljoin, parse_soup
 from company_research_agent.schemas.ir_schemas import (
     IRDocument,
     IRTemplateConfig,
@@ -23,6 +33,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# スクレイプ結果キャッシュの有効期間（秒）。IR一覧ページの更新頻度は
+# 低いため、同一セッション内の再実行ではネットワークとパースを省略する
+_SCRAPE_CACHE_TTL = 3600.0
+
+
+@lru_cache(maxsize=256)
+def _load_template_yaml(yaml_path: Path) -> IRTemplateConfig:
+    """テンプレートYAMLを読み込んでパースする（ファイルパスでメモ化）.
+
+    例外時はキャッシュされないため、パース失敗のテンプレートは
+    次回呼び出しで再試行される。
+
+    Args:
+        yaml_path: テンプレートYAMLのパス
+
+    Returns:
+        テンプレート設定
+    """
+    with open(yaml_path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    config = IRTemplateConfig.model_validate(data)
+    logger.debug(f"Loaded template: {yaml_path}")
+    return config
+
 
 class CustomScraper(Protocol):
     """カスタムスクレイパーのプロトコル.
@@ -75,41 +110,38 @@ class TemplateLoader:
         else:
             self._templates_dir = templates_dir
 
-        self._templates: dict[str, IRTemplateConfig] = {}
         self._custom_scrapers: dict[str, CustomScraper] = {}
 
+        # (証券コード, カテゴリ) -> (取得時刻, 結果) のスクレイプ結果キャッシュ
+        self._scrape_cache: dict[tuple[str, str | None], tuple[float, list[IRDocument]]] = {}
+
+        # ディレクトリを1回だけ走査して{証券コード: パス}の索引を構築する
+        # （{sec_code}_{company_name}.yaml形式のみを対象）
+        self._index: dict[str, Path] = {}
+        if self._templates_dir.exists():
+            for yaml_file in sorted(self._templates_dir.glob("*.yaml")):
+                parts = yaml_file.stem.split("_")
+                if parts and parts[0].isdigit() and len(parts[0]) == 5:
+                    self._index.setdefault(parts[0], yaml_file)
+
     def load_template(self, sec_code: str) -> IRTemplateConfig | None:
         """証券コードからテンプレートを読み込む.
 
+        パスの解決はインスタンスの索引、YAMLの読み込みはlru_cacheで共有される。
+
         Args:
             sec_code: 証券コード（5桁）
 
         Returns:
             テンプレート設定。見つからない場合はNone。
         """
-        # キャッシュ確認
-        if sec_code in self._templates:
-            return self._templates[sec_code]
-
-        # ファイル検索（{sec_code}_{company_name}.yaml形式）
-        pattern = f"{sec_code}_*.yaml"
-        yaml_files = list(self._templates_dir.glob(pattern))
-
-        if not yaml_files:
+        yaml_path = self._index.get(sec_code)
+        if yaml_path is None:
             logger.debug(f"No template found for sec_code: {sec_code}")
             return None
 
-        yaml_path = yaml_files[0]  # 最初にマッチしたファイルを使用
-
         try:
-            with open(yaml_path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-
-            config = IRTemplateConfig.model_validate(data)
-            self._templates[sec_code] = config
-            logger.debug(f"Loaded template for {sec_code}: {yaml_path}")
-            return config
-
+            return _load_template_yaml(yaml_path)
         except Exception as e:
             logger.error(f"Failed to load template {yaml_path}: {e}")
             return None
@@ -120,18 +152,7 @@ class TemplateLoader:
         Returns:
             証券コードのリスト
         """
-        sec_codes: list[str] = []
-
-        if not self._templates_dir.exists():
-            return sec_codes
-
-        for yaml_file in self._templates_dir.glob("*.yaml"):
-            # ファイル名から証券コードを抽出（{sec_code}_{company_name}.yaml）
-            parts = yaml_file.stem.split("_")
-            if parts and parts[0].isdigit() and len(parts[0]) == 5:
-                sec_codes.append(parts[0])
-
-        return sorted(sec_codes)
+        return sorted(self._index)
 
     async def scrape_with_template(
         self,
@@ -149,11 +170,23 @@ class TemplateLoader:
         Returns:
             抽出されたIR資料のリスト
         """
+        # 同一セッション内の再実行はキャッシュで応答（TTL内のみ）
+        cache_key = (template.company.sec_code, category)
+        cached = self._scrape_cache.get(cache_key)
+        if cached is not None:
+            cached_at, cached_docs = cached
+            if time.monotonic() - cached_at < _SCRAPE_CACHE_TTL:
+                logger.debug(f"Scrape cache hit for {cache_key}")
+                return list(cached_docs)
+
         # カスタムスクレイパーが指定されている場合
         if template.custom_class:
             custom_scraper = self._load_custom_scraper(template.custom_class)
             if custom_scraper:
-                return await custom_scraper.scrape(scraper, template, category)
+                documents = await custom_scraper.scrape(scraper, template, category)
+                if documents:
+                    self._scrape_cache[cache_key] = (time.monotonic(), list(documents))
+                return documents
 
         documents: list[IRDocument] = []
         base_url = template.ir_page.base_url
@@ -167,12 +200,18 @@ class TemplateLoader:
             # セクションURLを構築
             section_url = urljoin(base_url, section_config.url)
 
+            # リンクパターンはアンカーごとではなくセクション単位で1回だけコンパイルする
+            link_pattern = (
+                re.compile(section_config.link_pattern) if section_config.link_pattern else None
+            )
+
             try:
                 # ページを取得
                 html = await scraper.fetch_page(section_url)
 
-                # BeautifulSoupで解析
-                soup = BeautifulSoup(html, "html.parser")
+                # 同一HTMLの再パースを避けるキャッシュ付きヘルパーでパース
+                # （読み取りのみでツリーは変更しない）
+                soup = parse_soup(html)
 
                 # セレクターで要素を抽出
                 elements = soup.select(section_config.selector)
@@ -183,7 +222,7 @@ class TemplateLoader:
                         element=element,
                         base_url=section_url,
                         category=cat,
-                        link_pattern=section_config.link_pattern,
+                        link_pattern=link_pattern,
                         date_selector=section_config.date_selector,
                         date_format=section_config.date_format,
                     )
@@ -194,14 +233,41 @@ class TemplateLoader:
                 logger.error(f"Failed to scrape {cat} section at {section_url}: {e}")
                 continue
 
+        # 一時的な取得失敗をTTLの間固定しないよう、空の結果はキャッシュしない
+        if documents:
+            self._scrape_cache[cache_key] = (time.monotonic(), list(documents))
+
         return documents
 
+    async def scrape_all_categories(
+        self,
+        scraper: BaseIRScraper,
+        template: IRTemplateConfig,
+    ) -> dict[str, list[IRDocument]]:
+        """全カテゴリのIR資料を並列に取得する.
+
+        各セクションは独立したURLのため、fetch_pageを逐次awaitせず
+        asyncio.gatherで同時に発行し、待ち時間を最長の1ページ分に抑える。
+
+        Args:
+            scraper: BaseIRScraperインスタンス
+            template: テンプレート設定
+
+        Returns:
+            カテゴリ名をキーとするIR資料リストの辞書
+        """
+        categories = list(template.ir_page.sections)
+        results = await asyncio.gather(
+            *[self.scrape_with_template(scraper, template, category=cat) for cat in categories]
+        )
+        return dict(zip(categories, results, strict=True))
+
     def _extract_document_from_element(
         self,
         element: Tag,
         base_url: str,
         category: str,
-        link_pattern: str | None = None,
+        link_pattern: str | re.Pattern[str] | None = None,
         date_selector: str | None = None,
         date_format: str | None = None,
     ) -> IRDocument | None:
@@ -211,7 +277,7 @@ class TemplateLoader:
             element: BeautifulSoup Tag要素
             base_url: ベースURL
             category: カテゴリ
-            link_pattern: リンクをフィルタリングする正規表現
+            link_pattern: リンクをフィルタリングする正規表現（コンパイル済み可）
             date_selector: 日付を抽出するセレクター
             date_format: 日付フォーマット
 
@@ -229,17 +295,17 @@ class TemplateLoader:
 
         href = str(href)
 
+        # PDFリンクのみを対象（大半のリンクはここで弾けるため正規表現より先に判定）
+        if not href.lower().endswith(".pdf"):
+            return None
+
         # リンクパターンでフィルタリング
         if link_pattern:
             if not re.search(link_pattern, href):
                 return None
 
-        # PDFリンクのみを対象
-        if not href.lower().endswith(".pdf"):
-            return None
-
-        # 絶対URLに変換
-        url = urljoin(base_url, href)
+        # 絶対URLに変換（アンカーごとのurljoin再パースを避ける）
+        url = fast_urljoin(base_url, href)
 
         # タイトルを取得
         title = element.get_text(strip=True)
@@ -11,6 +11,7 @@ Example:
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Literal
 
@@ -55,6 +56,7 @@ class EDINETConfig(BaseSettings):
         EDINET_BASE_URL: EDINET APIベースURL
         EDINET_TIMEOUT_LIST: 一覧取得タイムアウト（秒）
         EDINET_TIMEOUT_DOWNLOAD: ダウンロードタイムアウト（秒）
+        EDINET_MAX_RETRIES: サーバーエラー時の最大試行回数
     """
 
     model_config = SettingsConfigDict(
@@ -84,6 +86,11 @@ class EDINETConfig(BaseSettings):
         alias="EDINET_TIMEOUT_DOWNLOAD",
         description="ダウンロードタイムアウト（秒）",
     )
+    max_retries: int = Field(
+        default=3,
+        alias="EDINET_MAX_RETRIES",
+        description="サーバーエラー時の最大試行回数",
+    )
 
 
 class LLMConfig(BaseSettings):
@@ -331,8 +338,7 @@ class AppConfig(BaseSettings):
     def edinet(self) -> EDINETConfig:
         """EDINET設定を取得（遅延初期化）."""
         if self._edinet is None:
-            # pydantic-settingsが環境変数から値を読み込むため、引数は不要
-            self._edinet = EDINETConfig()  # type: ignore[call-arg]
+            self._edinet = get_edinet_config()
         return self._edinet
 
 
@@ -352,10 +358,26 @@ def get_config() -> AppConfig:
     return _config
 
 
+@functools.lru_cache(maxsize=1)
+def get_edinet_config() -> EDINETConfig:
+    """EDINET設定を取得（プロセス内キャッシュ）.
+
+    構築のたびに.envの読み込み・環境変数の走査・バリデーションが
+    走るため、結果をキャッシュして2回目以降は同一インスタンスを返す。
+    環境変数を変更するテストでは get_edinet_config.cache_clear() を呼ぶ。
+
+    Returns:
+        EDINETConfigインスタンス（シングルトン）
+    """
+    # pydantic-settingsが環境変数から値を読み込むため、引数は不要
+    return EDINETConfig()  # type: ignore[call-arg]
+
+
 def reset_config() -> None:
     """設定をリセット（テスト用）."""
     global _config
     _config = None
+    get_edinet_config.cache_clear()
 
 
 # 後方互換性のためのエイリアス
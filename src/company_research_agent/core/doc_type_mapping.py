@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import sys
+import types
+from collections.abc import Mapping
+
 # EDINET書類種別コードと日本語名のマッピング
 # 参照: EDINET API仕様書
-DOC_TYPE_NAMES: dict[str, str] = {
+_RAW_DOC_TYPE_NAMES: dict[str, str] = {
     # 有価証券報告書関連
     "120": "有価証券報告書",
     "130": "訂正有価証券報告書",
@@ -41,6 +45,14 @@ DOC_TYPE_NAMES: dict[str, str] = {
     "020": "訂正目論見書",
 }
 
+# キー・値をinternして書類行ごとの照合をポインタ比較相当にし、
+# 読み取り専用ビューで公開して定数への変更を防ぐ
+DOC_TYPE_NAMES: Mapping[str, str] = types.MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _RAW_DOC_TYPE_NAMES.items()}
+)
+
+_OTHER = sys.intern("その他")
+
 
 def get_doc_type_name(doc_type_code: str | None) -> str:
     """Get Japanese name for a document type code.
@@ -57,6 +69,5 @@ def get_doc_type_name(doc_type_code: str | None) -> str:
         >>> get_doc_type_name("999")
         'その他'
     """
-    if doc_type_code is None:
-        return "その他"
-    return DOC_TYPE_NAMES.get(doc_type_code, "その他")
+    # Noneキーのgetは単にミスして既定値を返すため、None分岐は不要
+    return DOC_TYPE_NAMES.get(doc_type_code, _OTHER)  # type: ignore[arg-type]
@@ -56,9 +56,13 @@ class EDINETServerError(EDINETAPIError):
     """Raised when EDINET API returns a server error (5xx).
 
     This error is retryable as it may be a transient issue.
+
+    Attributes:
+        retry_after: Seconds to wait before retrying, taken from the
+            Retry-After response header when present.
     """
 
-    pass
+    retry_after: float | None = None
 
 
 @dataclass
@@ -8,11 +8,13 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CompanyInfo:
     """企業情報.
 
     EDINETコードリストから取得した企業の基本情報。
+    約5千社分を常駐させる読み取り専用のマスターデータのため、
+    frozen＋slotsでインスタンスごとの__dict__を持たない。
 
     Attributes:
         edinet_code: EDINETコード（例: E02144）
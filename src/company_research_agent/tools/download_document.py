@@ -9,7 +9,7 @@ from typing import Annotated
 from langchain_core.tools import tool
 
 from company_research_agent.clients.edinet_client import EDINETClient
-from company_research_agent.core.config import EDINETConfig
+from company_research_agent.core.config import get_edinet_config
 from company_research_agent.core.download_path import build_download_path
 from company_research_agent.core.progress import print_info, print_status, print_success
 from company_research_agent.services.local_cache_service import LocalCacheService
@@ -90,7 +90,7 @@ async def download_document(
     print_status(f"EDINETからダウンロード中: {doc_id}")
     print_info(f"保存先: {save_path}")
 
-    config = EDINETConfig()  # type: ignore[call-arg]
+    config = get_edinet_config()
     async with EDINETClient(config) as client:
         result_path = await client.download_document(doc_id, 2, save_path)
 
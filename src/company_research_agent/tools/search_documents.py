@@ -9,7 +9,7 @@ from typing import Annotated, Any
 from langchain_core.tools import tool
 
 from company_research_agent.clients.edinet_client import EDINETClient
-from company_research_agent.core.config import EDINETConfig
+from company_research_agent.core.config import get_edinet_config
 from company_research_agent.core.progress import print_info, print_status, print_success
 from company_research_agent.schemas.document_filter import DocumentFilter, SearchOrder
 from company_research_agent.services.edinet_document_service import EDINETDocumentService
@@ -110,7 +110,7 @@ async def search_documents(
         max_documents=max_documents,
     )
 
-    config = EDINETConfig()  # type: ignore[call-arg]
+    config = get_edinet_config()
     async with EDINETClient(config) as client:
         service = EDINETDocumentService(client)
         documents = await service.search_documents(doc_filter)
@@ -10,7 +10,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from company_research_agent.core.config import EDINETConfig
+from company_research_agent.core.config import EDINETConfig, get_edinet_config
 from company_research_agent.workflows.nodes.base import AnalysisNode
 from company_research_agent.workflows.state import AnalysisState
 
@@ -52,7 +52,7 @@ class EDINETNode(AnalysisNode[str]):
         """設定を取得する."""
         if self._config is None:
             # pydantic-settings reads from environment variables
-            self._config = EDINETConfig()  # type: ignore[call-arg]
+            self._config = get_edinet_config()
         return self._config
 
     async def execute(self, state: AnalysisState) -> str:
@@ -3,6 +3,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import orjson
 import pytest
 
 from company_research_agent.core.config import EDINETConfig
@@ -19,98 +20,121 @@ def edinet_config() -> EDINETConfig:
     )
 
 
-@pytest.fixture
-def sample_document_list_response() -> dict[str, object]:
-    """Provide a sample EDINET document list API response."""
-    return {
-        "metadata": {
-            "title": "提出された書類を把握するためのAPI",
-            "parameter": {"date": "2024-01-15", "type": "2"},
-            "resultset": {"count": 2},
-            "processDateTime": "2024-01-15 10:00",
-            "status": "200",
-            "message": "OK",
+# Sample API responses are built once at module load and shared across tests.
+# Treat them as read-only: mutate a copy, never the shared dict.
+_SAMPLE_DOCUMENT_LIST: dict[str, object] = {
+    "metadata": {
+        "title": "提出された書類を把握するためのAPI",
+        "parameter": {"date": "2024-01-15", "type": "2"},
+        "resultset": {"count": 2},
+        "processDateTime": "2024-01-15 10:00",
+        "status": "200",
+        "message": "OK",
+    },
+    "results": [
+        {
+            "seqNumber": 1,
+            "docID": "S100TEST",
+            "edinetCode": "E10001",
+            "secCode": "10000",
+            "JCN": "6000012010023",
+            "filerName": "テスト株式会社",
+            "fundCode": None,
+            "ordinanceCode": "010",
+            "formCode": "030000",
+            "docTypeCode": "120",
+            "periodStart": "2023-04-01",
+            "periodEnd": "2024-03-31",
+            "submitDateTime": "2024-01-15 09:00",
+            "docDescription": "有価証券報告書－第10期",
+            "issuerEdinetCode": None,
+            "subjectEdinetCode": None,
+            "subsidiaryEdinetCode": None,
+            "currentReportReason": None,
+            "parentDocID": None,
+            "opeDateTime": None,
+            "withdrawalStatus": "0",
+            "docInfoEditStatus": "0",
+            "disclosureStatus": "0",
+            "xbrlFlag": "1",
+            "pdfFlag": "1",
+            "attachDocFlag": "0",
+            "englishDocFlag": "0",
+            "csvFlag": "1",
+            "legalStatus": "1",
+        },
+        {
+            "seqNumber": 2,
+            "docID": "S100TST2",
+            "edinetCode": "E10002",
+            "secCode": "20000",
+            "JCN": "6000012010024",
+            "filerName": "サンプル株式会社",
+            "fundCode": None,
+            "ordinanceCode": "010",
+            "formCode": "043000",
+            "docTypeCode": "140",
+            "periodStart": "2023-10-01",
+            "periodEnd": "2023-12-31",
+            "submitDateTime": "2024-01-15 09:30",
+            "docDescription": "四半期報告書－第10期第3四半期",
+            "issuerEdinetCode": None,
+            "subjectEdinetCode": None,
+            "subsidiaryEdinetCode": None,
+            "currentReportReason": None,
+            "parentDocID": None,
+            "opeDateTime": None,
+            "withdrawalStatus": "0",
+            "docInfoEditStatus": "0",
+            "disclosureStatus": "0",
+            "xbrlFlag": "1",
+            "pdfFlag": "1",
+            "attachDocFlag": "0",
+            "englishDocFlag": "0",
+            "csvFlag": "0",
+            "legalStatus": "1",
         },
-        "results": [
-            {
-                "seqNumber": 1,
-                "docID": "S100TEST",
-                "edinetCode": "E10001",
-                "secCode": "10000",
-                "JCN": "6000012010023",
-                "filerName": "テスト株式会社",
-                "fundCode": None,
-                "ordinanceCode": "010",
-                "formCode": "030000",
-                "docTypeCode": "120",
-                "periodStart": "2023-04-01",
-                "periodEnd": "2024-03-31",
-                "submitDateTime": "2024-01-15 09:00",
-                "docDescription": "有価証券報告書－第10期",
-                "issuerEdinetCode": None,
-                "subjectEdinetCode": None,
-                "subsidiaryEdinetCode": None,
-                "currentReportReason": None,
-                "parentDocID": None,
-                "opeDateTime": None,
-                "withdrawalStatus": "0",
-                "docInfoEditStatus": "0",
-                "disclosureStatus": "0",
-                "xbrlFlag": "1",
-                "pdfFlag": "1",
-                "attachDocFlag": "0",
-                "englishDocFlag": "0",
-                "csvFlag": "1",
-                "legalStatus": "1",
-            },
-            {
-                "seqNumber": 2,
-                "docID": "S100TST2",
-                "edinetCode": "E10002",
-                "secCode": "20000",
-                "JCN": "6000012010024",
-                "filerName": "サンプル株式会社",
-                "fundCode": None,
-                "ordinanceCode": "010",
-                "formCode": "043000",
-                "docTypeCode": "140",
-                "periodStart": "2023-10-01",
-                "periodEnd": "2023-12-31",
-                "submitDateTime": "2024-01-15 09:30",
-                "docDescription": "四半期報告書－第10期第3四半期",
-                "issuerEdinetCode": None,
-                "subjectEdinetCode": None,
-                "subsidiaryEdinetCode": None,
-                "currentReportReason": None,
-                "parentDocID": None,
-                "opeDateTime": None,
-                "withdrawalStatus": "0",
-                "docInfoEditStatus": "0",
-                "disclosureStatus": "0",
-                "xbrlFlag": "1",
-                "pdfFlag": "1",
-                "attachDocFlag": "0",
-                "englishDocFlag": "0",
-                "csvFlag": "0",
-                "legalStatus": "1",
-            },
-        ],
+    ],
+}
+
+_SAMPLE_METADATA_ONLY: dict[str, object] = {
+    "metadata": {
+        "title": "提出された書類を把握するためのAPI",
+        "parameter": {"date": "2024-01-15", "type": "1"},
+        "resultset": {"count": 50},
+        "processDateTime": "2024-01-15 10:00",
+        "status": "200",
+        "message": "OK",
     }
+}
 
+# Serialized once so respx can return raw bytes without per-test JSON encoding
+_DOCUMENT_LIST_BYTES = orjson.dumps(_SAMPLE_DOCUMENT_LIST)
+_METADATA_ONLY_BYTES = orjson.dumps(_SAMPLE_METADATA_ONLY)
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def sample_document_list_response() -> dict[str, object]:
+    """Provide a sample EDINET document list API response."""
+    return _SAMPLE_DOCUMENT_LIST
+
+
+@pytest.fixture(scope="session")
 def sample_metadata_only_response() -> dict[str, object]:
     """Provide a sample EDINET metadata-only (type=1) response."""
-    return {
-        "metadata": {
-            "title": "提出された書類を把握するためのAPI",
-            "parameter": {"date": "2024-01-15", "type": "1"},
-            "resultset": {"count": 50},
-            "processDateTime": "2024-01-15 10:00",
-            "status": "200",
-            "message": "OK",
-        }
-    }
+    return _SAMPLE_METADATA_ONLY
+
+
+@pytest.fixture(scope="session")
+def sample_document_list_bytes() -> bytes:
+    """Provide the document list response pre-serialized as JSON bytes."""
+    return _DOCUMENT_LIST_BYTES
+
+
+@pytest.fixture(scope="session")
+def sample_metadata_only_bytes() -> bytes:
+    """Provide the metadata-only response pre-serialized as JSON bytes."""
+    return _METADATA_ONLY_BYTES
 
 
 # PDF Parser fixtures
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from io import StringIO
-from unittest.mock import patch
+from contextlib import redirect_stdout
+from functools import cache
 
 import pytest
 
@@ -18,24 +18,102 @@ from company_research_agent.cli.output import (
 from company_research_agent.schemas.edinet_schemas import DocumentMetadata
 from company_research_agent.schemas.query_schemas import CompanyInfo
 
+# pytest-xdist実行時にファイル単位でワーカーへ割り当てる
+pytestmark = pytest.mark.xdist_group("cli_output")
+
+
+class _Sink:
+    """list.append + join で文字列を構築する軽量なstdout代替."""
+
+    def __init__(self) -> None:
+        self.parts: list[str] = []
+
+    def write(self, s: str) -> None:
+        self.parts.append(s)
+
+    def flush(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return "".join(self.parts)
+
+
+@cache
+def _sample_company_cached() -> CompanyInfo:
+    """サンプル企業情報を一度だけ構築して再利用する."""
+    return CompanyInfo(
+        edinet_code="E02144",
+        sec_code="72030",
+        company_name="トヨタ自動車株式会社",
+        company_name_kana="トヨタジドウシャ",
+        company_name_en="TOYOTA MOTOR CORPORATION",
+        listing_code="1",
+        industry_code="3700",
+    )
+
+
+@cache
+def _sample_documents_cached() -> tuple[DocumentMetadata, ...]:
+    """サンプル書類メタデータを一度だけ構築して再利用する.
+
+    既知の妥当な値のためmodel_constructでバリデーションを省略する。
+    （フラグ類は変換後のbool値を直接渡す）
+    """
+    return (
+        DocumentMetadata.model_construct(
+            seq_number=1,
+            doc_id="S100ABCD",
+            edinet_code="E02144",
+            sec_code="72030",
+            filer_name="トヨタ自動車株式会社",
+            doc_type_code="120",
+            submit_date_time="2024-06-20 15:30",
+            withdrawal_status="0",
+            xbrl_flag=True,
+            pdf_flag=True,
+            attach_doc_flag=False,
+            english_doc_flag=False,
+            csv_flag=False,
+            legal_status="1",
+        ),
+        DocumentMetadata.model_construct(
+            seq_number=2,
+            doc_id="S100EFGH",
+            edinet_code="E02144",
+            sec_code="72030",
+            filer_name="トヨタ自動車株式会社",
+            doc_type_code="140",
+            submit_date_time="2024-08-10 16:00",
+            withdrawal_status="0",
+            xbrl_flag=True,
+            pdf_flag=True,
+            attach_doc_flag=False,
+            english_doc_flag=False,
+            csv_flag=False,
+            legal_status="1",
+        ),
+    )
+
 
 class TestPrintHeader:
     """print_header() のテスト."""
 
     def test_prints_title_with_decorations(self) -> None:
         """タイトルが装飾付きで出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_header("テストタイトル")
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
         assert "=" * 60 in output
         assert "テストタイトル" in output
 
     def test_title_is_indented(self) -> None:
         """タイトルがインデントされていること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_header("タイトル")
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
         # タイトル行にスペースが含まれる
         assert "  タイトル" in output
@@ -46,9 +124,10 @@ class TestPrintError:
 
     def test_prints_error_prefix(self) -> None:
         """[ERROR] プレフィックスが付くこと."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_error("エラーメッセージ")
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
         assert "[ERROR]" in output
         assert "エラーメッセージ" in output
@@ -59,9 +138,10 @@ class TestPrintSuccess:
 
     def test_prints_success_prefix(self) -> None:
         """[OK] プレフィックスが付くこと."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_success("成功メッセージ")
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
         assert "[OK]" in output
         assert "成功メッセージ" in output
@@ -72,9 +152,10 @@ class TestPrintInfo:
 
     def test_prints_info_prefix(self) -> None:
         """[INFO] プレフィックスが付くこと."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_info("情報メッセージ")
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
         assert "[INFO]" in output
         assert "情報メッセージ" in output
@@ -83,58 +164,28 @@ class TestPrintInfo:
 class TestPrintCompanyInfo:
     """print_company_info() のテスト."""
 
+    EXPECTED_FIELDS = (
+        "トヨタ自動車株式会社",
+        "E02144",
+        "72030",
+        "トヨタジドウシャ",
+        "TOYOTA MOTOR CORPORATION",
+    )
+
     @pytest.fixture
     def sample_company(self) -> CompanyInfo:
-        """サンプル企業情報を作成."""
-        return CompanyInfo(
-            edinet_code="E02144",
-            sec_code="72030",
-            company_name="トヨタ自動車株式会社",
-            company_name_kana="トヨタジドウシャ",
-            company_name_en="TOYOTA MOTOR CORPORATION",
-            listing_code="1",
-            industry_code="3700",
-        )
-
-    def test_prints_company_name(self, sample_company: CompanyInfo) -> None:
-        """企業名が出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_company_info(sample_company)
-            output = mock_stdout.getvalue()
+        """サンプル企業情報を返す（検証済みインスタンスを再利用）."""
+        return _sample_company_cached()
 
-        assert "トヨタ自動車株式会社" in output
-
-    def test_prints_edinet_code(self, sample_company: CompanyInfo) -> None:
-        """EDINETコードが出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_company_info(sample_company)
-            output = mock_stdout.getvalue()
-
-        assert "E02144" in output
-
-    def test_prints_sec_code(self, sample_company: CompanyInfo) -> None:
-        """証券コードが出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+    def test_prints_all_expected_fields(self, sample_company: CompanyInfo) -> None:
+        """企業名・各コード・カナ名・英語名が出力されること."""
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_company_info(sample_company)
-            output = mock_stdout.getvalue()
-
-        assert "72030" in output
+        output = sink.getvalue()
 
-    def test_prints_kana_when_available(self, sample_company: CompanyInfo) -> None:
-        """カナ名が存在する場合に出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_company_info(sample_company)
-            output = mock_stdout.getvalue()
-
-        assert "トヨタジドウシャ" in output
-
-    def test_prints_en_name_when_available(self, sample_company: CompanyInfo) -> None:
-        """英語名が存在する場合に出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_company_info(sample_company)
-            output = mock_stdout.getvalue()
-
-        assert "TOYOTA MOTOR CORPORATION" in output
+        missing = [s for s in self.EXPECTED_FIELDS if s not in output]
+        assert not missing, f"出力に含まれないフィールド: {missing}"
 
     def test_handles_missing_sec_code(self) -> None:
         """証券コードがない場合に (未上場) と表示されること."""
@@ -147,9 +198,10 @@ class TestPrintCompanyInfo:
             listing_code=None,
             industry_code=None,
         )
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_company_info(company)
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
         assert "(未上場)" in output
 
@@ -157,97 +209,48 @@ class TestPrintCompanyInfo:
 class TestPrintDocumentsTable:
     """print_documents_table() のテスト."""
 
+    EXPECTED_FIELDS = (
+        # ヘッダー行
+        "No",
+        "提出日",
+        "書類ID",
+        "種別",
+        "企業名",
+        # 区切り線
+        "-" * 80,
+        # 書類行
+        "S100ABCD",
+        "S100EFGH",
+        "トヨタ自動車株式会社",
+        # 書類種別コードの日本語変換
+        "有価証券報告書",
+        "四半期報告書",
+        # 日時からの日付抽出
+        "2024-06-20",
+        "2024-08-10",
+    )
+
     @pytest.fixture
     def sample_documents(self) -> list[DocumentMetadata]:
-        """サンプル書類リストを作成."""
-        return [
-            DocumentMetadata(
-                seqNumber=1,
-                docID="S100ABCD",
-                edinetCode="E02144",
-                secCode="72030",
-                filerName="トヨタ自動車株式会社",
-                docTypeCode="120",
-                submitDateTime="2024-06-20 15:30",
-                withdrawalStatus="0",
-                xbrlFlag="1",
-                pdfFlag="1",
-                attachDocFlag="0",
-                englishDocFlag="0",
-                csvFlag="0",
-                legalStatus="1",
-            ),
-            DocumentMetadata(
-                seqNumber=2,
-                docID="S100EFGH",
-                edinetCode="E02144",
-                secCode="72030",
-                filerName="トヨタ自動車株式会社",
-                docTypeCode="140",
-                submitDateTime="2024-08-10 16:00",
-                withdrawalStatus="0",
-                xbrlFlag="1",
-                pdfFlag="1",
-                attachDocFlag="0",
-                englishDocFlag="0",
-                csvFlag="0",
-                legalStatus="1",
-            ),
-        ]
-
-    def test_prints_header_row(self, sample_documents: list[DocumentMetadata]) -> None:
-        """ヘッダー行が出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_documents_table(sample_documents)
-            output = mock_stdout.getvalue()
-
-        assert "No" in output
-        assert "提出日" in output
-        assert "書類ID" in output
-        assert "種別" in output
-        assert "企業名" in output
-
-    def test_prints_separator_line(self, sample_documents: list[DocumentMetadata]) -> None:
-        """区切り線が出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_documents_table(sample_documents)
-            output = mock_stdout.getvalue()
-
-        assert "-" * 80 in output
-
-    def test_prints_document_rows(self, sample_documents: list[DocumentMetadata]) -> None:
-        """書類行が出力されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_documents_table(sample_documents)
-            output = mock_stdout.getvalue()
-
-        assert "S100ABCD" in output
-        assert "S100EFGH" in output
-        assert "トヨタ自動車株式会社" in output
-
-    def test_translates_doc_type_code(self, sample_documents: list[DocumentMetadata]) -> None:
-        """書類種別コードが日本語に変換されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
-            print_documents_table(sample_documents)
-            output = mock_stdout.getvalue()
-
-        assert "有価証券報告書" in output
-        assert "四半期報告書" in output
+        """サンプル書類リストを返す（検証済みインスタンスを再利用）."""
+        return list(_sample_documents_cached())
 
-    def test_extracts_date_from_datetime(self, sample_documents: list[DocumentMetadata]) -> None:
-        """日時から日付部分のみが抽出されること."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+    def test_prints_all_expected_fields(self, sample_documents: list[DocumentMetadata]) -> None:
+        """ヘッダー行・区切り線・書類行・種別変換・日付抽出がまとめて出力されること."""
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_documents_table(sample_documents)
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
-        assert "2024-06-20" in output
-        assert "2024-08-10" in output
+        missing = [s for s in self.EXPECTED_FIELDS if s not in output]
+        assert not missing, f"出力に含まれないフィールド: {missing}"
 
     def test_handles_empty_list(self) -> None:
         """空リストでもエラーにならないこと."""
-        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        sink = _Sink()
+        with redirect_stdout(sink):
             print_documents_table([])
-            output = mock_stdout.getvalue()
+        output = sink.getvalue()
 
         # ヘッダーは出力される
         assert "No" in output
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 
+from company_research_agent.cli import rich_output
 from company_research_agent.cli.rich_output import (
     print_chat_goodbye,
     print_chat_welcome,
@@ -18,6 +19,17 @@ from company_research_agent.cli.rich_output import (
 )
 from company_research_agent.schemas.query_schemas import OrchestratorResult
 
+# pytest-xdist実行時にファイル単位でワーカーへ割り当てる
+pytestmark = pytest.mark.xdist_group("cli_output")
+
+
+@pytest.fixture(autouse=True)
+def mock_console(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Rich consoleをテストごとにモックへ差し替える."""
+    mock = MagicMock()
+    monkeypatch.setattr(rich_output, "console", mock)
+    return mock
+
 
 class TestPrintQueryResult:
     """print_query_result() のテスト."""
@@ -33,14 +45,14 @@ class TestPrintQueryResult:
             documents=[],
         )
 
-    def test_prints_panel_with_result(self, sample_result: OrchestratorResult) -> None:
+    def test_prints_panel_with_result(
+        self, sample_result: OrchestratorResult, mock_console: MagicMock
+    ) -> None:
         """結果がパネル形式で出力されること."""
-        # Rich consoleの出力をキャプチャ
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_query_result(sample_result)
-            mock_console.print.assert_called_once()
+        print_query_result(sample_result)
+        mock_console.print.assert_called_once()
 
-    def test_handles_none_result(self) -> None:
+    def test_handles_none_result(self, mock_console: MagicMock) -> None:
         """結果がNoneの場合にも動作すること."""
         result = OrchestratorResult(
             query="test",
@@ -49,11 +61,10 @@ class TestPrintQueryResult:
             tools_used=[],
             documents=[],
         )
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_query_result(result)
-            mock_console.print.assert_called_once()
+        print_query_result(result)
+        mock_console.print.assert_called_once()
 
-    def test_handles_list_content_multimodal(self) -> None:
+    def test_handles_list_content_multimodal(self, mock_console: MagicMock) -> None:
         """リスト形式（マルチモーダル）のcontentを正しく処理すること."""
         result = OrchestratorResult(
             query="test",
@@ -62,11 +73,10 @@ class TestPrintQueryResult:
             tools_used=[],
             documents=[],
         )
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_query_result(result)
-            mock_console.print.assert_called_once()
+        print_query_result(result)
+        mock_console.print.assert_called_once()
 
-    def test_handles_multiple_text_blocks(self) -> None:
+    def test_handles_multiple_text_blocks(self, mock_console: MagicMock) -> None:
         """複数のtextブロックを正しく処理すること."""
         result = OrchestratorResult(
             query="test",
@@ -78,11 +88,10 @@ class TestPrintQueryResult:
             tools_used=[],
             documents=[],
         )
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_query_result(result)
-            mock_console.print.assert_called_once()
+        print_query_result(result)
+        mock_console.print.assert_called_once()
 
-    def test_handles_empty_list_result(self) -> None:
+    def test_handles_empty_list_result(self, mock_console: MagicMock) -> None:
         """空のリストの場合に「結果なし」を表示すること."""
         result = OrchestratorResult(
             query="test",
@@ -91,11 +100,10 @@ class TestPrintQueryResult:
             tools_used=[],
             documents=[],
         )
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_query_result(result)
-            mock_console.print.assert_called_once()
+        print_query_result(result)
+        mock_console.print.assert_called_once()
 
-    def test_ignores_non_text_blocks_in_list(self) -> None:
+    def test_ignores_non_text_blocks_in_list(self, mock_console: MagicMock) -> None:
         """リスト内のtext以外のブロックは無視すること."""
         result = OrchestratorResult(
             query="test",
@@ -107,102 +115,92 @@ class TestPrintQueryResult:
             tools_used=[],
             documents=[],
         )
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_query_result(result)
-            mock_console.print.assert_called_once()
+        print_query_result(result)
+        mock_console.print.assert_called_once()
 
 
 class TestPrintThinking:
     """print_thinking() のテスト."""
 
-    def test_prints_dim_message(self) -> None:
+    def test_prints_dim_message(self, mock_console: MagicMock) -> None:
         """薄い色でメッセージが出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_thinking("処理中...")
-            mock_console.print.assert_called_once()
-            call_args = mock_console.print.call_args[0][0]
-            assert "[dim]" in call_args
-            assert "処理中..." in call_args
+        print_thinking("処理中...")
+        mock_console.print.assert_called_once()
+        call_args = mock_console.print.call_args[0][0]
+        assert "[dim]" in call_args
+        assert "処理中..." in call_args
 
 
 class TestPrintToolCall:
     """print_tool_call() のテスト."""
 
-    def test_prints_tool_name(self) -> None:
+    def test_prints_tool_name(self, mock_console: MagicMock) -> None:
         """ツール名が出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_tool_call("search_company")
-            mock_console.print.assert_called_once()
-            call_args = mock_console.print.call_args[0][0]
-            assert "search_company" in call_args
+        print_tool_call("search_company")
+        mock_console.print.assert_called_once()
+        call_args = mock_console.print.call_args[0][0]
+        assert "search_company" in call_args
 
-    def test_prints_tool_with_args(self) -> None:
+    def test_prints_tool_with_args(self, mock_console: MagicMock) -> None:
         """引数付きでツールが出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_tool_call("search_company", {"name": "トヨタ"})
-            mock_console.print.assert_called_once()
-            call_args = mock_console.print.call_args[0][0]
-            assert "search_company" in call_args
-            assert "name=" in call_args
+        print_tool_call("search_company", {"name": "トヨタ"})
+        mock_console.print.assert_called_once()
+        call_args = mock_console.print.call_args[0][0]
+        assert "search_company" in call_args
+        assert "name=" in call_args
 
 
 class TestPrintToolsSummary:
     """print_tools_summary() のテスト."""
 
-    def test_prints_tools_list(self) -> None:
+    def test_prints_tools_list(self, mock_console: MagicMock) -> None:
         """ツールリストが出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_tools_summary(["search_company", "search_documents"])
-            mock_console.print.assert_called_once()
-            call_args = mock_console.print.call_args[0][0]
-            assert "search_company" in call_args
-            assert "search_documents" in call_args
-
-    def test_no_output_for_empty_list(self) -> None:
+        print_tools_summary(["search_company", "search_documents"])
+        mock_console.print.assert_called_once()
+        call_args = mock_console.print.call_args[0][0]
+        assert "search_company" in call_args
+        assert "search_documents" in call_args
+
+    def test_no_output_for_empty_list(self, mock_console: MagicMock) -> None:
         """空リストの場合は出力しないこと."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_tools_summary([])
-            mock_console.print.assert_not_called()
+        print_tools_summary([])
+        mock_console.print.assert_not_called()
 
 
 class TestPrintChatWelcome:
     """print_chat_welcome() のテスト."""
 
-    def test_prints_welcome_panel(self) -> None:
+    def test_prints_welcome_panel(self, mock_console: MagicMock) -> None:
         """ウェルカムパネルが出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_chat_welcome()
-            # 複数回printが呼ばれる（空行含む）
-            assert mock_console.print.call_count >= 1
+        print_chat_welcome()
+        # 複数回printが呼ばれる（空行含む）
+        assert mock_console.print.call_count >= 1
 
 
 class TestPrintChatGoodbye:
     """print_chat_goodbye() のテスト."""
 
-    def test_prints_goodbye_message(self) -> None:
+    def test_prints_goodbye_message(self, mock_console: MagicMock) -> None:
         """終了メッセージが出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_chat_goodbye()
-            mock_console.print.assert_called_once()
+        print_chat_goodbye()
+        mock_console.print.assert_called_once()
 
 
 class TestPrintHistoryCleared:
     """print_history_cleared() のテスト."""
 
-    def test_prints_clear_message(self) -> None:
+    def test_prints_clear_message(self, mock_console: MagicMock) -> None:
         """履歴クリアメッセージが出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_history_cleared()
-            mock_console.print.assert_called_once()
-            call_args = mock_console.print.call_args[0][0]
-            assert "クリア" in call_args
+        print_history_cleared()
+        mock_console.print.assert_called_once()
+        call_args = mock_console.print.call_args[0][0]
+        assert "クリア" in call_args
 
 
 class TestPrintProcessing:
     """print_processing() のテスト."""
 
-    def test_prints_processing_message(self) -> None:
+    def test_prints_processing_message(self, mock_console: MagicMock) -> None:
         """処理中メッセージが出力されること."""
-        with patch("company_research_agent.cli.rich_output.console") as mock_console:
-            print_processing()
-            mock_console.print.assert_called_once()
+        print_processing()
+        mock_console.print.assert_called_once()
@@ -0,0 +1,85 @@
+"""Shared fixtures for ir_scraper tests."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import yaml
+
+# YAMLコメント行の除去パターン（1回のC実装パスで除去する）
+_COMMENT_RE = re.compile(r"(?m)^\s*#[^\n]*\n?")
+
+# specを固定しておくことでモック生成時の属性イントロスペクションを抑える
+_SCRAPER_SPEC = type("_ScraperSpec", (), {"fetch_page": None})
+_PROVIDER_SPEC = type("_ProviderSpec", (), {"ainvoke_structured": None})
+
+
+@pytest.fixture
+def make_scraper() -> Callable[[str | Exception], MagicMock]:
+    """fetch_pageの戻り値（または例外）を指定したスクレイパーモックを作成する."""
+
+    def _make(html_or_exc: str | Exception) -> MagicMock:
+        scraper = MagicMock(spec=_SCRAPER_SPEC)
+        if isinstance(html_or_exc, Exception):
+            scraper.fetch_page = AsyncMock(side_effect=html_or_exc)
+        else:
+            scraper.fetch_page = AsyncMock(return_value=html_or_exc)
+        return scraper
+
+    return _make
+
+
+@pytest.fixture
+def make_provider() -> Callable[[object], MagicMock]:
+    """ainvoke_structuredの戻り値（または例外）を指定したLLMプロバイダーモックを作成する."""
+
+    def _make(response_or_exc: object) -> MagicMock:
+        provider = MagicMock(spec=_PROVIDER_SPEC)
+        if isinstance(response_or_exc, Exception):
+            provider.ainvoke_structured = AsyncMock(side_effect=response_or_exc)
+        else:
+            provider.ainvoke_structured = AsyncMock(return_value=response_or_exc)
+        return provider
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def templates_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """セッション全体で共有するテンプレート保存用のルートディレクトリ.
+
+    テストごとのtmp_path生成・削除を避け、ファイルシステム操作を抑える。
+    """
+    return tmp_path_factory.mktemp("tpl")
+
+
+@pytest.fixture
+def templates_dir(templates_root: Path, request: pytest.FixtureRequest) -> Path:
+    """テストごとに一意なテンプレート保存ディレクトリ."""
+    d = templates_root / request.node.name
+    d.mkdir()
+    return d
+
+
+@pytest.fixture(scope="session")
+def parse_saved_template() -> Callable[[Path], dict[str, Any]]:
+    """保存済みテンプレートYAMLをコメント除去してパースする.
+
+    mtimeをキーにメモ化し、同一ファイルの再パースを避ける。
+    パースにはlibyamlのCSafeLoaderを使用する。
+    """
+    _cache: dict[tuple[Path, float], dict[str, Any]] = {}
+
+    def _parse(filepath: Path) -> dict[str, Any]:
+        key = (filepath, filepath.stat().st_mtime)
+        if key not in _cache:
+            content = filepath.read_text(encoding="utf-8")
+            _cache[key] = yaml.load(_COMMENT_RE.sub("", content), Loader=yaml.CSafeLoader)
+        return _cache[key]
+
+    return _parse
@@ -3,7 +3,9 @@
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+import pytest_asyncio
 
 from company_research_agent.clients.ir_scraper.base import BaseIRScraper
 from company_research_agent.core.exceptions import (
@@ -11,6 +13,17 @@ from company_research_agent.core.exceptions import (
 )
 
 
+def make_async_client(response: MagicMock) -> AsyncMock:
+    """httpx.AsyncClient互換のコンテキストマネージャーモックを作成する."""
+    client = AsyncMock(
+        get=AsyncMock(return_value=response),
+        __aexit__=AsyncMock(return_value=None),
+    )
+    # __aenter__ だけは自身を返す必要があるため生成後に束縛する
+    client.__aenter__ = AsyncMock(return_value=client)
+    return client
+
+
 class TestBaseIRScraper:
     """Tests for BaseIRScraper class."""
 
@@ -78,9 +91,12 @@ class TestBaseIRScraper:
     class TestFetchPage:
         """Tests for fetch_page method."""
 
-        @pytest.mark.asyncio
-        async def test_fetch_page_success(self) -> None:
-            """ページ取得が成功すること."""
+        @pytest_asyncio.fixture
+        async def wired_scraper(self) -> tuple[BaseIRScraper, AsyncMock, MagicMock]:
+            """モックページを配線済みのスクレイパーを作成する.
+
+            テスト側は mock_response.status を書き換えるだけでよい。
+            """
             scraper = BaseIRScraper(rate_limit_seconds=0)  # テスト用にレート制限を無効化
 
             mock_page = AsyncMock()
@@ -93,6 +109,14 @@ class TestBaseIRScraper:
             mock_context = AsyncMock()
             mock_context.new_page = AsyncMock(return_value=mock_page)
             scraper._context = mock_context
+            return scraper, mock_page, mock_response
+
+        @pytest.mark.asyncio
+        async def test_fetch_page_success(
+            self, wired_scraper: tuple[BaseIRScraper, AsyncMock, MagicMock]
+        ) -> None:
+            """ページ取得が成功すること."""
+            scraper, mock_page, _ = wired_scraper
 
             result = await scraper.fetch_page("https://example.com/ir")
 
@@ -100,6 +124,18 @@ class TestBaseIRScraper:
             mock_page.goto.assert_called_once()
             mock_page.close.assert_called_once()
 
+        @pytest.mark.asyncio
+        async def test_fetch_page_max_chars(
+            self, wired_scraper: tuple[BaseIRScraper, AsyncMock, MagicMock]
+        ) -> None:
+            """max_chars指定時にHTMLが切り詰められること."""
+            scraper, mock_page, _ = wired_scraper
+            mock_page.content = AsyncMock(return_value="<html>" + "x" * 100 + "</html>")
+
+            result = await scraper.fetch_page("https://example.com/ir", max_chars=10)
+
+            assert result == "<html>xxxx"
+
         @pytest.mark.asyncio
         async def test_fetch_page_not_initialized(self) -> None:
             """初期化されていない場合にエラーが発生すること."""
@@ -112,19 +148,12 @@ class TestBaseIRScraper:
             assert "not initialized" in str(exc_info.value)
 
         @pytest.mark.asyncio
-        async def test_fetch_page_http_error(self) -> None:
+        async def test_fetch_page_http_error(
+            self, wired_scraper: tuple[BaseIRScraper, AsyncMock, MagicMock]
+        ) -> None:
             """HTTPエラーの場合にIRPageAccessErrorが発生すること."""
-            scraper = BaseIRScraper(rate_limit_seconds=0)
-
-            mock_page = AsyncMock()
-            mock_response = MagicMock()
+            scraper, _, mock_response = wired_scraper
             mock_response.status = 404
-            mock_page.goto = AsyncMock(return_value=mock_response)
-            mock_page.close = AsyncMock()
-
-            mock_context = AsyncMock()
-            mock_context.new_page = AsyncMock(return_value=mock_page)
-            scraper._context = mock_context
 
             with pytest.raises(IRPageAccessError) as exc_info:
                 await scraper.fetch_page("https://example.com/not-found")
@@ -140,17 +169,13 @@ class TestBaseIRScraper:
             scraper = BaseIRScraper(rate_limit_seconds=0)
             save_path = tmp_path / "test.pdf"
 
-            mock_response = MagicMock()
+            mock_response = MagicMock(spec=httpx.Response)
             mock_response.status_code = 200
             mock_response.content = b"%PDF-1.4 test content"
             mock_response.raise_for_status = MagicMock()
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client.get = AsyncMock(return_value=mock_response)
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=None)
-                mock_client_class.return_value = mock_client
+            with patch.object(httpx, "AsyncClient") as mock_client_class:
+                mock_client_class.return_value = make_async_client(mock_response)
 
                 result = await scraper.download_pdf("https://example.com/doc.pdf", save_path)
 
@@ -166,7 +191,7 @@ class TestBaseIRScraper:
             save_path.write_text("existing content")
 
             # httpxがcallされないことを確認
-            with patch("httpx.AsyncClient") as mock_client_class:
+            with patch.object(httpx, "AsyncClient") as mock_client_class:
                 result = await scraper.download_pdf("https://example.com/doc.pdf", save_path)
 
                 assert result == save_path
@@ -179,17 +204,13 @@ class TestBaseIRScraper:
             save_path = tmp_path / "existing.pdf"
             save_path.write_text("old content")
 
-            mock_response = MagicMock()
+            mock_response = MagicMock(spec=httpx.Response)
             mock_response.status_code = 200
             mock_response.content = b"new content"
             mock_response.raise_for_status = MagicMock()
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client.get = AsyncMock(return_value=mock_response)
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=None)
-                mock_client_class.return_value = mock_client
+            with patch.object(httpx, "AsyncClient") as mock_client_class:
+                mock_client_class.return_value = make_async_client(mock_response)
 
                 result = await scraper.download_pdf(
                     "https://example.com/doc.pdf", save_path, force=True
@@ -206,17 +227,13 @@ class TestBaseIRScraper:
             """robots.txtでアクセスが許可されている場合."""
             scraper = BaseIRScraper()
 
-            mock_response = MagicMock()
+            mock_response = MagicMock(spec=httpx.Response)
             mock_response.status_code = 200
             mock_response.text = "User-agent: *\nDisallow: /admin/"
             mock_response.raise_for_status = MagicMock()
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client.get = AsyncMock(return_value=mock_response)
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=None)
-                mock_client_class.return_value = mock_client
+            with patch.object(httpx, "AsyncClient") as mock_client_class:
+                mock_client_class.return_value = make_async_client(mock_response)
 
                 result = await scraper.check_robots_txt("https://example.com", "/ir/documents")
 
@@ -227,17 +244,13 @@ class TestBaseIRScraper:
             """robots.txtでアクセスが禁止されている場合."""
             scraper = BaseIRScraper()
 
-            mock_response = MagicMock()
+            mock_response = MagicMock(spec=httpx.Response)
             mock_response.status_code = 200
             mock_response.text = "User-agent: *\nDisallow: /ir/"
             mock_response.raise_for_status = MagicMock()
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client.get = AsyncMock(return_value=mock_response)
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=None)
-                mock_client_class.return_value = mock_client
+            with patch.object(httpx, "AsyncClient") as mock_client_class:
+                mock_client_class.return_value = make_async_client(mock_response)
 
                 result = await scraper.check_robots_txt("https://example.com", "/ir/documents")
 
@@ -248,51 +261,53 @@ class TestBaseIRScraper:
             """robots.txtが存在しない場合（全て許可）."""
             scraper = BaseIRScraper()
 
-            mock_response = MagicMock()
+            mock_response = MagicMock(spec=httpx.Response)
             mock_response.status_code = 404
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client.get = AsyncMock(return_value=mock_response)
-                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                mock_client.__aexit__ = AsyncMock(return_value=None)
-                mock_client_class.return_value = mock_client
+            with patch.object(httpx, "AsyncClient") as mock_client_class:
+                mock_client_class.return_value = make_async_client(mock_response)
 
                 result = await scraper.check_robots_txt("https://example.com", "/any/path")
 
                 assert result is True
 
         @pytest.mark.asyncio
-        async def test_check_robots_txt_uses_cache(self) -> None:
+        async def test_check_robots_txt_uses_cache(self, monkeypatch: pytest.MonkeyPatch) -> None:
             """robots.txtキャッシュが使用されること."""
             scraper = BaseIRScraper()
             # 事前にキャッシュを設定
             scraper._robots_cache["https://example.com/robots.txt"] = {"/blocked/"}
 
-            # httpxが呼ばれないことを確認
-            with patch("httpx.AsyncClient") as mock_client_class:
-                result = await scraper.check_robots_txt("https://example.com", "/allowed/path")
+            # httpxが呼ばれないことを確認（クライアント生成をスパイで監視）
+            called: list[int] = []
+            monkeypatch.setattr(
+                httpx, "AsyncClient", lambda *a, **kw: called.append(1) or AsyncMock()
+            )
+            result = await scraper.check_robots_txt("https://example.com", "/allowed/path")
 
-                assert result is True
-                mock_client_class.assert_not_called()
+            assert result is True
+            assert not called
 
     class TestResolveUrl:
         """Tests for resolve_url method."""
 
-        def test_resolve_absolute_url(self) -> None:
+        @pytest.fixture(scope="class")
+        @classmethod
+        def scraper(cls) -> BaseIRScraper:
+            """resolve_urlは純粋関数のためインスタンスをクラス内で共有する."""
+            return BaseIRScraper()
+
+        def test_resolve_absolute_url(self, scraper: BaseIRScraper) -> None:
             """絶対URLはそのまま返されること."""
-            scraper = BaseIRScraper()
             result = scraper.resolve_url("https://example.com/ir", "https://other.com/doc.pdf")
             assert result == "https://other.com/doc.pdf"
 
-        def test_resolve_relative_url(self) -> None:
+        def test_resolve_relative_url(self, scraper: BaseIRScraper) -> None:
             """相対URLが解決されること."""
-            scraper = BaseIRScraper()
             result = scraper.resolve_url("https://example.com/ir/", "documents/report.pdf")
             assert result == "https://example.com/ir/documents/report.pdf"
 
-        def test_resolve_root_relative_url(self) -> None:
+        def test_resolve_root_relative_url(self, scraper: BaseIRScraper) -> None:
             """ルート相対URLが解決されること."""
-            scraper = BaseIRScraper()
             result = scraper.resolve_url("https://example.com/ir/page", "/assets/doc.pdf")
             assert result == "https://example.com/assets/doc.pdf"
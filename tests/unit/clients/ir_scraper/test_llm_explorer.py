@@ -1,8 +1,8 @@
 """Tests for LLMExplorer."""
 
-from unittest.mock import AsyncMock, MagicMock
-
-import pytest
+import asyncio
+from collections.abc import Callable
+from unittest.mock import MagicMock
 
 from company_research_agent.clients.ir_scraper.llm_explorer import LLMExplorer
 from company_research_agent.schemas.ir_schemas import (
@@ -90,12 +90,14 @@ class TestLLMExplorer:
     class TestExploreIrPage:
         """Tests for explore_ir_page method."""
 
-        @pytest.mark.asyncio
-        async def test_explore_returns_documents(self) -> None:
+        async def test_explore_returns_documents(
+            self,
+            make_scraper: Callable[[str | Exception], MagicMock],
+            make_provider: Callable[[object], MagicMock],
+        ) -> None:
             """IRページからドキュメントを抽出できること."""
-            mock_provider = MagicMock()
-            mock_provider.ainvoke_structured = AsyncMock(
-                return_value=ExtractedLinksResponse(
+            mock_provider = make_provider(
+                ExtractedLinksResponse(
                     links=[
                         ExtractedLink(
                             title="決算説明会資料",
@@ -115,9 +117,7 @@ class TestLLMExplorer:
                     page_description="企業のIRページ",
                 )
             )
-
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(return_value="<html><body>IR Page</body></html>")
+            mock_scraper = make_scraper("<html><body>IR Page</body></html>")
 
             explorer = LLMExplorer(llm_provider=mock_provider)
             docs = await explorer.explore_ir_page(mock_scraper, "https://example.com/ir/")
@@ -130,43 +130,39 @@ class TestLLMExplorer:
             # 相対URLが絶対URLに変換されていること
             assert docs[1].url.startswith("https://")
 
-        @pytest.mark.asyncio
-        async def test_explore_handles_empty_response(self) -> None:
-            """空のレスポンスを処理できること."""
-            mock_provider = MagicMock()
-            mock_provider.ainvoke_structured = AsyncMock(
-                return_value=ExtractedLinksResponse(links=[], page_description="")
-            )
-
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(return_value="<html></html>")
+        async def test_explore_handles_edge_cases(
+            self,
+            make_scraper: Callable[[str | Exception], MagicMock],
+            make_provider: Callable[[object], MagicMock],
+        ) -> None:
+            """空レスポンスとスクレイパーエラーをともに空リストで処理できること.
 
-            explorer = LLMExplorer(llm_provider=mock_provider)
-            docs = await explorer.explore_ir_page(mock_scraper, "https://example.com")
-
-            assert docs == []
-
-        @pytest.mark.asyncio
-        async def test_explore_handles_scraper_error(self) -> None:
-            """スクレイパーエラーを処理できること."""
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(side_effect=Exception("Network error"))
-
-            explorer = LLMExplorer()
-            docs = await explorer.explore_ir_page(mock_scraper, "https://example.com")
+            各シナリオは独立したモックを持つため、gatherで並行実行する。
+            """
+            empty_provider = make_provider(ExtractedLinksResponse(links=[], page_description=""))
+            empty_scraper = make_scraper("<html></html>")
+            error_scraper = make_scraper(Exception("Network error"))
+
+            empty_docs, error_docs = await asyncio.gather(
+                LLMExplorer(llm_provider=empty_provider).explore_ir_page(
+                    empty_scraper, "https://example.com"
+                ),
+                LLMExplorer().explore_ir_page(error_scraper, "https://example.com"),
+            )
 
+            assert empty_docs == []
             # エラー時は空リストを返す
-            assert docs == []
+            assert error_docs == []
 
     class TestFindIrPageUrl:
         """Tests for find_ir_page_url method."""
 
-        @pytest.mark.asyncio
-        async def test_find_ir_page_by_url_pattern(self) -> None:
-            """URLパターンでIRページを見つけられること."""
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(
-                return_value="""
+        async def test_find_ir_page_scenarios(
+            self, make_scraper: Callable[[str | Exception], MagicMock]
+        ) -> None:
+            """URLパターン・テキスト一致・未検出の各シナリオを並行実行できること."""
+            by_url_scraper = make_scraper(
+                """
                 <html>
                 <body>
                 <a href="/ir/">IR情報</a>
@@ -174,18 +170,8 @@ class TestLLMExplorer:
                 </html>
                 """
             )
-
-            explorer = LLMExplorer()
-            url = await explorer.find_ir_page_url(mock_scraper, "https://example.com")
-
-            assert url == "https://example.com/ir/"
-
-        @pytest.mark.asyncio
-        async def test_find_ir_page_by_text(self) -> None:
-            """テキストでIRページを見つけられること."""
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(
-                return_value="""
+            by_text_scraper = make_scraper(
+                """
                 <html>
                 <body>
                 <a href="/investor-relations/">投資家情報</a>
@@ -193,19 +179,8 @@ class TestLLMExplorer:
                 </html>
                 """
             )
-
-            explorer = LLMExplorer()
-            url = await explorer.find_ir_page_url(mock_scraper, "https://example.com")
-
-            assert url is not None
-            assert "investor-relations" in url
-
-        @pytest.mark.asyncio
-        async def test_find_ir_page_not_found(self) -> None:
-            """IRページが見つからない場合Noneを返すこと."""
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(
-                return_value="""
+            not_found_scraper = make_scraper(
+                """
                 <html>
                 <body>
                 <a href="/about/">会社概要</a>
@@ -215,7 +190,16 @@ class TestLLMExplorer:
                 """
             )
 
-            explorer = LLMExplorer()
-            url = await explorer.find_ir_page_url(mock_scraper, "https://example.com")
+            by_url, by_text, not_found = await asyncio.gather(
+                LLMExplorer().find_ir_page_url(by_url_scraper, "https://example.com"),
+                LLMExplorer().find_ir_page_url(by_text_scraper, "https://example.com"),
+                LLMExplorer().find_ir_page_url(not_found_scraper, "https://example.com"),
+            )
 
-            assert url is None
+            # URLパターンでIRページを見つけられること
+            assert by_url == "https://example.com/ir/"
+            # テキストでIRページを見つけられること
+            assert by_text is not None
+            assert "investor-relations" in by_text
+            # 見つからない場合はNoneを返すこと
+            assert not_found is None
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-import yaml
 
 from company_research_agent.clients.ir_scraper.template_generator import (
     IRTemplateGenerator,
 )
+from company_research_agent.prompts.ir_template import IR_PAGE_ANALYSIS_PROMPT
 from company_research_agent.schemas.ir_schemas import (
     CompanyInfo,
     DiscoveredSection,
@@ -21,7 +22,7 @@ from company_research_agent.schemas.ir_schemas import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Callable
 
 
 class TestIRTemplateGenerator:
@@ -37,11 +38,11 @@ class TestIRTemplateGenerator:
             assert generator._templates_dir.name == "ir_templates"
             assert generator._llm_provider is None
 
-        def test_custom_templates_dir(self, tmp_path: Path) -> None:
+        def test_custom_templates_dir(self, templates_dir: Path) -> None:
             """カスタムテンプレートディレクトリを指定できること."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
-            assert generator._templates_dir == tmp_path
+            assert generator._templates_dir == templates_dir
 
         def test_custom_llm_provider(self) -> None:
             """カスタムLLMプロバイダーを指定できること."""
@@ -172,9 +173,11 @@ class TestIRTemplateGenerator:
     class TestSaveTemplate:
         """テンプレート保存のテスト."""
 
-        def test_save_basic_template(self, tmp_path: Path) -> None:
+        async def test_save_basic_template(
+            self, templates_dir: Path, parse_saved_template: Callable[[Path], dict[str, Any]]
+        ) -> None:
             """基本的なテンプレートを保存できること."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
             template = IRTemplateConfig(
                 company=CompanyInfo(
@@ -192,30 +195,27 @@ class TestIRTemplateGenerator:
                 ),
             )
 
-            filepath = generator.save_template(template)
+            filepath = await generator.save_template(template)
 
             assert filepath.exists()
             assert filepath.name == "72030_トヨタ自動車.yaml"
 
             # YAMLの内容を検証
-            with open(filepath, encoding="utf-8") as f:
-                content = f.read()
-                assert "# トヨタ自動車 IRテンプレート" in content
+            content = filepath.read_text(encoding="utf-8")
+            assert "# トヨタ自動車 IRテンプレート" in content
 
-                # コメント行を除去してYAMLをパース
-                yaml_content = "\n".join(
-                    line for line in content.split("\n") if not line.startswith("#")
-                )
-                data = yaml.safe_load(yaml_content)
+            data = parse_saved_template(filepath)
 
             assert data["company"]["sec_code"] == "72030"
             assert data["company"]["name"] == "トヨタ自動車"
             assert data["ir_page"]["base_url"] == "https://global.toyota/jp/ir/"
             assert "earnings" in data["ir_page"]["sections"]
 
-        def test_save_with_edinet_code(self, tmp_path: Path) -> None:
+        async def test_save_with_edinet_code(
+            self, templates_dir: Path, parse_saved_template: Callable[[Path], dict[str, Any]]
+        ) -> None:
             """EDINETコード付きテンプレートを保存できること."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
             template = IRTemplateConfig(
                 company=CompanyInfo(
@@ -229,20 +229,17 @@ class TestIRTemplateGenerator:
                 ),
             )
 
-            filepath = generator.save_template(template)
+            filepath = await generator.save_template(template)
 
-            with open(filepath, encoding="utf-8") as f:
-                content = f.read()
-                yaml_content = "\n".join(
-                    line for line in content.split("\n") if not line.startswith("#")
-                )
-                data = yaml.safe_load(yaml_content)
+            data = parse_saved_template(filepath)
 
             assert data["company"]["edinet_code"] == "E02144"
 
-        def test_save_with_all_section_fields(self, tmp_path: Path) -> None:
+        async def test_save_with_all_section_fields(
+            self, templates_dir: Path, parse_saved_template: Callable[[Path], dict[str, Any]]
+        ) -> None:
             """全フィールド付きセクションを保存できること."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
             template = IRTemplateConfig(
                 company=CompanyInfo(
@@ -263,23 +260,18 @@ class TestIRTemplateGenerator:
                 ),
             )
 
-            filepath = generator.save_template(template)
+            filepath = await generator.save_template(template)
 
-            with open(filepath, encoding="utf-8") as f:
-                content = f.read()
-                yaml_content = "\n".join(
-                    line for line in content.split("\n") if not line.startswith("#")
-                )
-                data = yaml.safe_load(yaml_content)
+            data = parse_saved_template(filepath)
 
             section = data["ir_page"]["sections"]["earnings"]
             assert section["link_pattern"] == r".*\.pdf$"
             assert section["date_selector"] == ".date"
             assert section["date_format"] == "%Y年%m月%d日"
 
-        def test_overwrite_existing(self, tmp_path: Path) -> None:
+        async def test_overwrite_existing(self, templates_dir: Path) -> None:
             """既存ファイルを上書きできること."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
             template = IRTemplateConfig(
                 company=CompanyInfo(
@@ -293,16 +285,16 @@ class TestIRTemplateGenerator:
             )
 
             # 1回目の保存
-            filepath1 = generator.save_template(template)
+            filepath1 = await generator.save_template(template)
             assert filepath1.exists()
 
             # 上書き保存
-            filepath2 = generator.save_template(template, overwrite=True)
+            filepath2 = await generator.save_template(template, overwrite=True)
             assert filepath2 == filepath1
 
-        def test_error_on_existing_without_overwrite(self, tmp_path: Path) -> None:
+        async def test_error_on_existing_without_overwrite(self, templates_dir: Path) -> None:
             """上書きなしで既存ファイルがある場合はエラーになること."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
             template = IRTemplateConfig(
                 company=CompanyInfo(
@@ -316,16 +308,15 @@ class TestIRTemplateGenerator:
             )
 
             # 1回目の保存
-            generator.save_template(template)
+            await generator.save_template(template)
 
             # 2回目はエラー
             with pytest.raises(FileExistsError):
-                generator.save_template(template, overwrite=False)
+                await generator.save_template(template, overwrite=False)
 
     class TestDiscoverSubpages:
         """サブページ発見のテスト."""
 
-        @pytest.mark.asyncio
         async def test_extract_ir_links(self) -> None:
             """IR関連リンクを抽出できること."""
             generator = IRTemplateGenerator()
@@ -355,7 +346,6 @@ class TestIRTemplateGenerator:
             assert "https://example.com/ir/earnings" in result
             assert "https://example.com/ir/news" in result
 
-        @pytest.mark.asyncio
         async def test_exclude_pdf_links(self) -> None:
             """PDFリンクは除外されること."""
             generator = IRTemplateGenerator()
@@ -381,7 +371,6 @@ class TestIRTemplateGenerator:
             assert len(result) == 1
             assert "https://example.com/ir/earnings" in result
 
-        @pytest.mark.asyncio
         async def test_exclude_external_domain(self) -> None:
             """外部ドメインのリンクは除外されること."""
             generator = IRTemplateGenerator()
@@ -407,7 +396,6 @@ class TestIRTemplateGenerator:
             assert len(result) == 1
             assert "https://example.com/ir/news" in result
 
-        @pytest.mark.asyncio
         async def test_limit_to_10_pages(self) -> None:
             """最大10ページに制限されること."""
             generator = IRTemplateGenerator()
@@ -430,12 +418,12 @@ class TestIRTemplateGenerator:
     class TestAnalyzePage:
         """ページ解析のテスト."""
 
-        @pytest.mark.asyncio
-        async def test_analyze_page_success(self) -> None:
+        async def test_analyze_page_success(
+            self, make_provider: Callable[[object], MagicMock]
+        ) -> None:
             """ページ解析が成功すること."""
-            mock_provider = MagicMock()
-            mock_provider.ainvoke_structured = AsyncMock(
-                return_value=MagicMock(
+            mock_provider = make_provider(
+                MagicMock(
                     sections=[
                         DiscoveredSection(
                             category="earnings",
@@ -461,11 +449,11 @@ class TestIRTemplateGenerator:
             assert result[0].category == "earnings"
             mock_provider.ainvoke_structured.assert_called_once()
 
-        @pytest.mark.asyncio
-        async def test_analyze_page_error_returns_empty(self) -> None:
+        async def test_analyze_page_error_returns_empty(
+            self, make_provider: Callable[[object], MagicMock]
+        ) -> None:
             """ページ解析エラー時は空リストを返すこと."""
-            mock_provider = MagicMock()
-            mock_provider.ainvoke_structured = AsyncMock(side_effect=Exception("LLM Error"))
+            mock_provider = make_provider(Exception("LLM Error"))
 
             generator = IRTemplateGenerator(llm_provider=mock_provider)
 
@@ -477,40 +465,43 @@ class TestIRTemplateGenerator:
 
             assert result == []
 
-        @pytest.mark.asyncio
         async def test_analyze_page_truncates_long_html(self) -> None:
             """長いHTMLは切り詰められること."""
+            # call_args経由の巨大プロンプト取り回しを避け、長さだけを記録する
+            captured: list[int] = []
+
+            async def spy(*, prompt: str, **kwargs: object) -> MagicMock:
+                captured.append(len(prompt))
+                return MagicMock(sections=[])
+
             mock_provider = MagicMock()
-            mock_provider.ainvoke_structured = AsyncMock(
-                return_value=MagicMock(sections=[]),
-            )
+            mock_provider.ainvoke_structured = spy
 
             generator = IRTemplateGenerator(llm_provider=mock_provider)
 
             # 50000文字のHTML
+            url = "https://example.com/ir/"
             long_html = "<html><body>" + "x" * 50000 + "</body></html>"
 
-            await generator._analyze_page(
-                "https://example.com/ir/",
-                long_html,
-                "テスト企業",
-            )
+            await generator._analyze_page(url, long_html, "テスト企業")
 
-            # プロンプトに渡されたHTMLが30000文字以下であることを確認
-            call_args = mock_provider.ainvoke_structured.call_args
-            prompt = call_args.kwargs["prompt"]
-            # truncatedコメントが含まれていることを確認
-            assert "<!-- truncated -->" in prompt
+            # プロンプト長が「テンプレート + 30000文字 + 切り詰めマーカー」以下であること
+            overhead = len(
+                IR_PAGE_ANALYSIS_PROMPT.format(url=url, company_name="テスト企業", html_content="")
+            )
+            assert captured[0] <= overhead + 30000 + len("\n<!-- truncated -->")
 
     class TestGenerateTemplate:
         """テンプレート生成のテスト."""
 
-        @pytest.mark.asyncio
-        async def test_generate_template_basic(self) -> None:
+        async def test_generate_template_basic(
+            self,
+            make_scraper: Callable[[str | Exception], MagicMock],
+            make_provider: Callable[[object], MagicMock],
+        ) -> None:
             """基本的なテンプレート生成ができること."""
-            mock_provider = MagicMock()
-            mock_provider.ainvoke_structured = AsyncMock(
-                return_value=MagicMock(
+            mock_provider = make_provider(
+                MagicMock(
                     sections=[
                         DiscoveredSection(
                             category="earnings",
@@ -524,8 +515,7 @@ class TestIRTemplateGenerator:
 
             generator = IRTemplateGenerator(llm_provider=mock_provider)
 
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(return_value="<html><body>Test</body></html>")
+            mock_scraper = make_scraper("<html><body>Test</body></html>")
 
             template = await generator.generate_template(
                 scraper=mock_scraper,
@@ -539,13 +529,79 @@ class TestIRTemplateGenerator:
             assert template.ir_page.base_url == "https://example.com/ir/"
             assert "earnings" in template.ir_page.sections
 
+        async def test_generate_template_parallel(
+            self,
+            make_scraper: Callable[[str | Exception], MagicMock],
+            make_provider: Callable[[object], MagicMock],
+        ) -> None:
+            """メイン・サブページの解析が1ページ1回のLLM呼び出しで並行実行されること."""
+            mock_provider = make_provider(MagicMock(sections=[]))
+
+            generator = IRTemplateGenerator(llm_provider=mock_provider)
+
+            # サブページ2件を含むメインページ
+            mock_scraper = make_scraper(
+                """
+                <html><body>
+                <a href="/ir/earnings">決算情報</a>
+                <a href="/ir/news">IRニュース</a>
+                </body></html>
+                """
+            )
+
+            await generator.generate_template(
+                scraper=mock_scraper,
+                sec_code="72030",
+                company_name="テスト企業",
+                ir_url="https://example.com/ir/",
+            )
+
+            # メインページ + サブページ2件 = 3回
+            assert mock_provider.ainvoke_structured.call_count == 3
+
+        async def test_subpage_fetch_concurrency_bounded(
+            self, make_provider: Callable[[object], MagicMock]
+        ) -> None:
+            """サブページ取得の同時実行数が5件以下に制限されること."""
+            mock_provider = make_provider(MagicMock(sections=[]))
+
+            generator = IRTemplateGenerator(llm_provider=mock_provider)
+
+            # サブページ10件を含むメインページ
+            links = "\n".join(f'<a href="/ir/news{i}">ニュース{i}</a>' for i in range(10))
+            main_html = f"<html><body>{links}</body></html>"
+
+            in_flight = 0
+            max_in_flight = 0
+
+            async def fetch_page(url: str, max_chars: int | None = None) -> str:
+                nonlocal in_flight, max_in_flight
+                if url == "https://example.com/ir/":
+                    return main_html
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return "<html><body></body></html>"
+
+            mock_scraper = MagicMock()
+            mock_scraper.fetch_page = AsyncMock(side_effect=fetch_page)
+
+            await generator.generate_template(
+                scraper=mock_scraper,
+                sec_code="72030",
+                company_name="テスト企業",
+                ir_url="https://example.com/ir/",
+            )
+
+            assert 1 <= max_in_flight <= 5
+
     class TestValidateTemplate:
         """テンプレート検証のテスト."""
 
-        @pytest.mark.asyncio
-        async def test_validate_returns_document_counts(self, tmp_path: Path) -> None:
+        async def test_validate_returns_document_counts(self, templates_dir: Path) -> None:
             """検証がドキュメント数を返すこと."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
             template = IRTemplateConfig(
                 company=CompanyInfo(
@@ -577,10 +633,9 @@ class TestIRTemplateGenerator:
 
             assert result["earnings"] == 2
 
-        @pytest.mark.asyncio
-        async def test_validate_error_returns_negative(self, tmp_path: Path) -> None:
+        async def test_validate_error_returns_negative(self, templates_dir: Path) -> None:
             """検証エラー時は-1を返すこと."""
-            generator = IRTemplateGenerator(templates_dir=tmp_path)
+            generator = IRTemplateGenerator(templates_dir=templates_dir)
 
             template = IRTemplateConfig(
                 company=CompanyInfo(
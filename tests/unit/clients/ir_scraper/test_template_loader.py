@@ -1,18 +1,51 @@
 """Tests for TemplateLoader."""
 
+import asyncio
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from types import SimpleNamespace
 
 import pytest
+from bs4 import BeautifulSoup
 
 from company_research_agent.clients.ir_scraper.template_loader import TemplateLoader
 
+# 各テストで重複していたHTMLフィクスチャはモジュール定数として共有する。
+# 本体側のparse_soupキャッシュと合わせて、同一HTMLのパースは1回で済む
+_TOYOTA_LIST_HTML = """
+<html>
+<body>
+<div class="ir-list">
+    <a href="doc1.pdf">決算説明会資料 2024Q1</a>
+    <a href="doc2.pdf">決算説明会資料 2024Q2</a>
+    <a href="other.html">その他</a>
+</div>
+</body>
+</html>
+"""
+
+_TOYOTA_RELATIVE_HTML = """
+<html>
+<div class="ir-list">
+    <a href="/ir/docs/report.pdf">レポート</a>
+</div>
+</html>
+"""
+
+_SONY_MIXED_HTML = """
+<html>
+<div class="ir-item">
+    <a href="doc.pdf">PDF資料</a>
+    <a href="page.html">HTMLページ</a>
+    <a href="doc.xlsx">Excel</a>
+</div>
+</html>
+"""
+
 
-@pytest.fixture
-def temp_templates_dir(tmp_path: Path) -> Path:
-    """テスト用のテンプレートディレクトリを作成."""
-    templates_dir = tmp_path / "ir_templates"
-    templates_dir.mkdir()
+@pytest.fixture(scope="session")
+def temp_templates_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """テスト用のテンプレートディレクトリを作成（読み取り専用・セッション共有）."""
+    templates_dir = tmp_path_factory.mktemp("ir_templates")
 
     # テスト用YAMLファイルを作成（link_patternはシングルクォートで）
     toyota_yaml = """
@@ -120,21 +153,11 @@ class TestTemplateLoader:
             template = loader.load_template("72030")
             assert template is not None
 
-            # モックスクレイパー
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(
-                return_value="""
-                <html>
-                <body>
-                <div class="ir-list">
-                    <a href="doc1.pdf">決算説明会資料 2024Q1</a>
-                    <a href="doc2.pdf">決算説明会資料 2024Q2</a>
-                    <a href="other.html">その他</a>
-                </div>
-                </body>
-                </html>
-                """
-            )
+            # AsyncMockより軽量な素のasync関数でスクレイパーを代用
+            async def fetch_page(url: str) -> str:
+                return _TOYOTA_LIST_HTML
+
+            mock_scraper = SimpleNamespace(fetch_page=fetch_page)
 
             docs = await loader.scrape_with_template(mock_scraper, template, category="earnings")
 
@@ -142,6 +165,28 @@ class TestTemplateLoader:
             assert all(doc.category == "earnings" for doc in docs)
             assert all(doc.url.endswith(".pdf") for doc in docs)
 
+        @pytest.mark.asyncio
+        async def test_scrape_caches_results_within_session(self, temp_templates_dir: Path) -> None:
+            """同一(証券コード, カテゴリ)の再実行はキャッシュから返すこと."""
+            loader = TemplateLoader(temp_templates_dir)
+            template = loader.load_template("72030")
+            assert template is not None
+
+            fetched_urls: list[str] = []
+
+            async def fetch_page(url: str) -> str:
+                fetched_urls.append(url)
+                return _TOYOTA_LIST_HTML
+
+            mock_scraper = SimpleNamespace(fetch_page=fetch_page)
+
+            docs1 = await loader.scrape_with_template(mock_scraper, template, category="earnings")
+            docs2 = await loader.scrape_with_template(mock_scraper, template, category="earnings")
+
+            assert docs1 == docs2
+            # 2回目はネットワークアクセスなし
+            assert len(fetched_urls) == 1
+
         @pytest.mark.asyncio
         async def test_scrape_handles_relative_urls(self, temp_templates_dir: Path) -> None:
             """相対URLを絶対URLに変換できること."""
@@ -149,16 +194,10 @@ class TestTemplateLoader:
             template = loader.load_template("72030")
             assert template is not None
 
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(
-                return_value="""
-                <html>
-                <div class="ir-list">
-                    <a href="/ir/docs/report.pdf">レポート</a>
-                </div>
-                </html>
-                """
-            )
+            async def fetch_page(url: str) -> str:
+                return _TOYOTA_RELATIVE_HTML
+
+            mock_scraper = SimpleNamespace(fetch_page=fetch_page)
 
             docs = await loader.scrape_with_template(mock_scraper, template, category="earnings")
 
@@ -173,35 +212,74 @@ class TestTemplateLoader:
             template = loader.load_template("67580")  # link_patternなし
             assert template is not None
 
-            mock_scraper = MagicMock()
-            mock_scraper.fetch_page = AsyncMock(
-                return_value="""
-                <html>
-                <div class="ir-item">
-                    <a href="doc.pdf">PDF資料</a>
-                    <a href="page.html">HTMLページ</a>
-                    <a href="doc.xlsx">Excel</a>
-                </div>
-                </html>
-                """
-            )
+            async def fetch_page(url: str) -> str:
+                return _SONY_MIXED_HTML
+
+            mock_scraper = SimpleNamespace(fetch_page=fetch_page)
 
             docs = await loader.scrape_with_template(mock_scraper, template, category="earnings")
 
             assert len(docs) == 1
             assert docs[0].url.endswith(".pdf")
 
+    class TestScrapeAllCategories:
+        """Tests for scrape_all_categories method."""
+
+        @pytest.mark.asyncio
+        async def test_scrape_all_categories_concurrent(self, tmp_path: Path) -> None:
+            """全セクションのfetch_pageが並列に発行されること."""
+            templates_dir = tmp_path / "ir_templates"
+            templates_dir.mkdir()
+            multi_yaml = """
+company:
+  sec_code: "99990"
+  name: "マルチセクション株式会社"
+
+ir_page:
+  base_url: "https://example.com/ir/"
+  sections:
+    earnings:
+      url: "earnings/"
+      selector: ".ir-list a"
+    news:
+      url: "news/"
+      selector: ".ir-list a"
+"""
+            (templates_dir / "99990_multi.yaml").write_text(multi_yaml)
+
+            loader = TemplateLoader(templates_dir)
+            template = loader.load_template("99990")
+            assert template is not None
+
+            in_flight = 0
+            max_in_flight = 0
+
+            async def fetch(url: str) -> str:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return '<div class="ir-list"><a href="doc.pdf">資料</a></div>'
+
+            mock_scraper = SimpleNamespace(fetch_page=fetch)
+
+            result = await loader.scrape_all_categories(mock_scraper, template)
+
+            assert set(result) == {"earnings", "news"}
+            assert all(len(docs) == 1 for docs in result.values())
+            # 2セクションが同時にin-flightになっていること
+            assert max_in_flight == 2
+
     class TestExtractDocumentFromElement:
         """Tests for _extract_document_from_element method."""
 
         def test_extract_from_anchor_element(self, temp_templates_dir: Path) -> None:
             """アンカー要素から情報を抽出できること."""
-            from bs4 import BeautifulSoup
-
             loader = TemplateLoader(temp_templates_dir)
 
             html = '<a href="report.pdf">年次報告書</a>'
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
             element = soup.find("a")
 
             doc = loader._extract_document_from_element(
@@ -217,12 +295,10 @@ class TestTemplateLoader:
 
         def test_extract_returns_none_for_non_pdf(self, temp_templates_dir: Path) -> None:
             """PDF以外のリンクの場合Noneを返すこと."""
-            from bs4 import BeautifulSoup
-
             loader = TemplateLoader(temp_templates_dir)
 
             html = '<a href="page.html">ページ</a>'
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
             element = soup.find("a")
 
             doc = loader._extract_document_from_element(
@@ -235,12 +311,10 @@ class TestTemplateLoader:
 
         def test_extract_with_link_pattern(self, temp_templates_dir: Path) -> None:
             """link_patternでフィルタリングできること."""
-            from bs4 import BeautifulSoup
-
             loader = TemplateLoader(temp_templates_dir)
 
             html = '<a href="2024_q1.pdf">Q1レポート</a>'
-            soup = BeautifulSoup(html, "html.parser")
+            soup = BeautifulSoup(html, "lxml")
             element = soup.find("a")
 
             # マッチするパターン
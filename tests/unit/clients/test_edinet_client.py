@@ -1,5 +1,7 @@
 """Tests for EDINET client."""
 
+import re
+from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
 
@@ -7,6 +9,7 @@ import httpx
 import pytest
 import respx
 
+from company_research_agent.clients import edinet_client as edinet_client_module
 from company_research_agent.clients.edinet_client import EDINETClient
 from company_research_agent.core.config import EDINETConfig
 from company_research_agent.core.exceptions import (
@@ -54,20 +57,35 @@ class TestEDINETClientContextManager:
         await client.close()  # Should not raise
 
 
-@respx.mock
 class TestGetDocumentList:
     """Tests for get_document_list method."""
 
+    # Routes are compiled once at class definition; each test only swaps
+    # the mocked response, avoiding per-test URL parsing in respx
+    router = respx.mock(assert_all_called=False)
+    doc_list = router.get("https://api.edinet-fsa.go.jp/api/v2/documents.json")
+
+    @pytest.fixture(autouse=True)
+    def _mock_api(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Activate the shared router and keep retry backoff fast in tests."""
+        monkeypatch.setattr(edinet_client_module, "_RETRY_BASE_DELAY", 0.01)
+        with self.router:
+            yield
+
     @pytest.mark.asyncio
     async def test_get_document_list_success(
         self,
         edinet_config: EDINETConfig,
-        sample_document_list_response: dict[str, object],
+        sample_document_list_bytes: bytes,
     ) -> None:
         """get_document_list should return DocumentListResponse on success."""
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents.json",
-        ).mock(return_value=httpx.Response(200, json=sample_document_list_response))
+        self.doc_list.mock(
+            return_value=httpx.Response(
+                200,
+                content=sample_document_list_bytes,
+                headers={"Content-Type": "application/json"},
+            )
+        )
 
         async with EDINETClient(edinet_config) as client:
             response = await client.get_document_list(date(2024, 1, 15))
@@ -80,12 +98,16 @@ class TestGetDocumentList:
     async def test_get_document_list_metadata_only(
         self,
         edinet_config: EDINETConfig,
-        sample_metadata_only_response: dict[str, object],
+        sample_metadata_only_bytes: bytes,
     ) -> None:
         """get_document_list with include_details=False should return metadata only."""
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents.json",
-        ).mock(return_value=httpx.Response(200, json=sample_metadata_only_response))
+        self.doc_list.mock(
+            return_value=httpx.Response(
+                200,
+                content=sample_metadata_only_bytes,
+                headers={"Content-Type": "application/json"},
+            )
+        )
 
         async with EDINETClient(edinet_config) as client:
             response = await client.get_document_list(date(2024, 1, 15), include_details=False)
@@ -96,9 +118,7 @@ class TestGetDocumentList:
     @pytest.mark.asyncio
     async def test_get_document_list_401_error(self, edinet_config: EDINETConfig) -> None:
         """get_document_list should raise EDINETAuthenticationError on 401."""
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents.json",
-        ).mock(
+        self.doc_list.mock(
             return_value=httpx.Response(
                 401,
                 json={"message": "Access denied due to invalid subscription key"},
@@ -115,9 +135,7 @@ class TestGetDocumentList:
     @pytest.mark.asyncio
     async def test_get_document_list_404_error(self, edinet_config: EDINETConfig) -> None:
         """get_document_list should raise EDINETNotFoundError on 404."""
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents.json",
-        ).mock(
+        self.doc_list.mock(
             return_value=httpx.Response(
                 404,
                 json={"message": "Not Found"},
@@ -143,9 +161,7 @@ class TestGetDocumentList:
                 "message": "Not Found",
             }
         }
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents.json",
-        ).mock(return_value=httpx.Response(200, json=error_response))
+        self.doc_list.mock(return_value=httpx.Response(200, json=error_response))
 
         async with EDINETClient(edinet_config) as client:
             with pytest.raises(EDINETNotFoundError) as exc_info:
@@ -155,29 +171,30 @@ class TestGetDocumentList:
 
     @pytest.mark.asyncio
     async def test_get_document_list_500_error_triggers_retry(
-        self, edinet_config: EDINETConfig, sample_document_list_response: dict[str, object]
+        self, edinet_config: EDINETConfig, sample_document_list_bytes: bytes
     ) -> None:
         """get_document_list should retry on 500 error."""
-        route = respx.get("https://api.edinet-fsa.go.jp/api/v2/documents.json")
-        route.side_effect = [
+        self.doc_list.side_effect = [
             httpx.Response(500, json={"message": "Internal Server Error"}),
-            httpx.Response(200, json=sample_document_list_response),
+            httpx.Response(
+                200,
+                content=sample_document_list_bytes,
+                headers={"Content-Type": "application/json"},
+            ),
         ]
 
         async with EDINETClient(edinet_config) as client:
             response = await client.get_document_list(date(2024, 1, 15))
 
         assert response.metadata.status == "200"
-        assert route.call_count == 2
+        assert self.doc_list.call_count == 2
 
     @pytest.mark.asyncio
     async def test_get_document_list_500_error_max_retries(
         self, edinet_config: EDINETConfig
     ) -> None:
         """get_document_list should fail after max retries on persistent 500."""
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents.json",
-        ).mock(
+        self.doc_list.mock(
             return_value=httpx.Response(
                 500,
                 json={"message": "Internal Server Error"},
@@ -189,21 +206,30 @@ class TestGetDocumentList:
                 await client.get_document_list(date(2024, 1, 15))
 
         assert exc_info.value.status_code == 500
+        assert self.doc_list.call_count == edinet_config.max_retries
 
 
-@respx.mock
 class TestDownloadDocument:
     """Tests for download_document method."""
 
+    # One compiled route matches every document ID used in this class
+    router = respx.mock(assert_all_called=False)
+    doc_dl = router.get(re.compile(r"https://api\.edinet-fsa\.go\.jp/api/v2/documents/S\w+"))
+
+    @pytest.fixture(autouse=True)
+    def _mock_api(self, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+        """Activate the shared router and keep retry backoff fast in tests."""
+        monkeypatch.setattr(edinet_client_module, "_RETRY_BASE_DELAY", 0.01)
+        with self.router:
+            yield
+
     @pytest.mark.asyncio
     async def test_download_document_pdf_success(
         self, edinet_config: EDINETConfig, tmp_path: Path
     ) -> None:
         """download_document should save PDF file on success."""
         pdf_content = b"%PDF-1.4 sample content"
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents/S100TEST",
-        ).mock(
+        self.doc_dl.mock(
             return_value=httpx.Response(
                 200,
                 content=pdf_content,
@@ -226,9 +252,7 @@ class TestDownloadDocument:
     ) -> None:
         """download_document should save ZIP file on success."""
         zip_content = b"PK\x03\x04 sample zip content"
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents/S100TEST",
-        ).mock(
+        self.doc_dl.mock(
             return_value=httpx.Response(
                 200,
                 content=zip_content,
@@ -251,9 +275,7 @@ class TestDownloadDocument:
     ) -> None:
         """download_document should create parent directories if needed."""
         pdf_content = b"%PDF-1.4 sample content"
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents/S100TEST",
-        ).mock(
+        self.doc_dl.mock(
             return_value=httpx.Response(
                 200,
                 content=pdf_content,
@@ -273,9 +295,7 @@ class TestDownloadDocument:
         self, edinet_config: EDINETConfig, tmp_path: Path
     ) -> None:
         """download_document should raise EDINETAuthenticationError on 401."""
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents/S100TEST",
-        ).mock(
+        self.doc_dl.mock(
             return_value=httpx.Response(
                 401,
                 json={"message": "Access denied"},
@@ -293,9 +313,7 @@ class TestDownloadDocument:
         self, edinet_config: EDINETConfig, tmp_path: Path
     ) -> None:
         """download_document should raise EDINETNotFoundError on 404."""
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents/S100INVALID",
-        ).mock(
+        self.doc_dl.mock(
             return_value=httpx.Response(
                 404,
                 json={"message": "Document not found"},
@@ -323,9 +341,7 @@ class TestDownloadDocument:
                 "message": "該当する書類が存在しません",
             }
         }
-        respx.get(
-            "https://api.edinet-fsa.go.jp/api/v2/documents/S100TEST",
-        ).mock(
+        self.doc_dl.mock(
             return_value=httpx.Response(
                 200,
                 json=error_response,
@@ -345,8 +361,7 @@ class TestDownloadDocument:
     ) -> None:
         """download_document should retry on 500 error."""
         pdf_content = b"%PDF-1.4 sample content"
-        route = respx.get("https://api.edinet-fsa.go.jp/api/v2/documents/S100TEST")
-        route.side_effect = [
+        self.doc_dl.side_effect = [
             httpx.Response(500, json={"message": "Internal Server Error"}),
             httpx.Response(200, content=pdf_content, headers={"Content-Type": "application/pdf"}),
         ]
@@ -357,4 +372,42 @@ class TestDownloadDocument:
             await client.download_document("S100TEST", 2, save_path)
 
         assert save_path.exists()
-        assert route.call_count == 2
+        assert self.doc_dl.call_count == 2
+
+
+class TestDownloadDocuments:
+    """Tests for download_documents method."""
+
+    router = respx.mock(assert_all_called=False)
+    doc_dl = router.get(re.compile(r"https://api\.edinet-fsa\.go\.jp/api/v2/documents/S\w+"))
+
+    @pytest.fixture(autouse=True)
+    def _mock_api(self) -> Iterator[None]:
+        """Activate the shared router."""
+        with self.router:
+            yield
+
+    @pytest.mark.asyncio
+    async def test_download_documents_concurrent_success(
+        self, edinet_config: EDINETConfig, tmp_path: Path
+    ) -> None:
+        """download_documents should download all documents and preserve order."""
+        pdf_content = b"%PDF-1.4 sample content"
+        self.doc_dl.mock(
+            return_value=httpx.Response(
+                200,
+                content=pdf_content,
+                headers={"Content-Type": "application/pdf"},
+            )
+        )
+
+        specs: list[tuple[str, int, Path]] = [
+            (f"S100TES{i}", 2, tmp_path / f"doc_{i}.pdf") for i in range(10)
+        ]
+
+        async with EDINETClient(edinet_config) as client:
+            result_paths = await client.download_documents(specs)
+
+        assert result_paths == [spec[2] for spec in specs]
+        assert self.doc_dl.call_count == 10
+        assert all(path.read_bytes() == pdf_content for path in result_paths)
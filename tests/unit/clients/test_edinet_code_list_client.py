@@ -2,6 +2,7 @@
 
 import io
 import zipfile
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -97,21 +98,33 @@ class TestCacheValidation:
 class TestDownloadAndExtract:
     """Tests for download and extract functionality."""
 
+    @staticmethod
+    def _mock_stream_client(mock_response: MagicMock) -> AsyncMock:
+        """client.stream(...)でmock_responseを返すAsyncClientモックを作る."""
+        stream_cm = MagicMock()
+        stream_cm.__aenter__ = AsyncMock(return_value=mock_response)
+        stream_cm.__aexit__ = AsyncMock(return_value=None)
+
+        mock_client = AsyncMock()
+        mock_client.stream = MagicMock(return_value=stream_cm)
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock(return_value=None)
+        return mock_client
+
     @pytest.mark.asyncio
     async def test_download_success(self, tmp_cache_dir: Path, sample_zip_content: bytes) -> None:
         """Should download and extract ZIP successfully."""
         client = EDINETCodeListClient(cache_dir=tmp_cache_dir)
 
+        async def aiter_bytes(chunk_size: int = 65536) -> AsyncIterator[bytes]:
+            yield sample_zip_content
+
         mock_response = MagicMock()
-        mock_response.content = sample_zip_content
         mock_response.raise_for_status = MagicMock()
+        mock_response.aiter_bytes = aiter_bytes
 
         with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
+            mock_client_class.return_value = self._mock_stream_client(mock_response)
 
             await client._download_and_extract()
 
@@ -123,19 +136,16 @@ class TestDownloadAndExtract:
         """Should raise CodeListDownloadError on HTTP error."""
         client = EDINETCodeListClient(cache_dir=tmp_cache_dir)
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_response = MagicMock()
-            mock_response.status_code = 500
-            mock_response.raise_for_status = MagicMock(
-                side_effect=httpx.HTTPStatusError(
-                    "Server Error", request=MagicMock(), response=mock_response
-                )
+        mock_response = MagicMock()
+        mock_response.status_code = 500
+        mock_response.raise_for_status = MagicMock(
+            side_effect=httpx.HTTPStatusError(
+                "Server Error", request=MagicMock(), response=mock_response
             )
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
-            mock_client_class.return_value = mock_client
+        )
+
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client_class.return_value = self._mock_stream_client(mock_response)
 
             with pytest.raises(CodeListDownloadError):
                 await client._download_and_extract()
@@ -158,6 +168,24 @@ class TestLoadFromCache:
         assert client._companies_by_sec_code is not None
         assert "72030" in client._companies_by_sec_code
 
+    def test_load_from_persisted_index(
+        self, tmp_cache_dir: Path, sample_csv_content: bytes
+    ) -> None:
+        """2回目以降のロードはpickleインデックスを使いCSVパースを省くこと."""
+        (tmp_cache_dir / "EdinetcodeDlInfo.csv").write_bytes(sample_csv_content)
+
+        client1 = EDINETCodeListClient(cache_dir=tmp_cache_dir)
+        client1._load_from_cache()
+        assert (tmp_cache_dir / "companies.pkl").exists()
+
+        client2 = EDINETCodeListClient(cache_dir=tmp_cache_dir)
+        with patch.object(client2, "_parse_csv") as mock_parse:
+            client2._load_from_cache()
+
+        mock_parse.assert_not_called()
+        assert client2._companies is not None
+        assert len(client2._companies) == 4
+
 
 class TestSearchCompanies:
     """Tests for company search functionality."""
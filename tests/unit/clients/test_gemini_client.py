@@ -1,7 +1,7 @@
 """Tests for Gemini API client."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -74,8 +74,8 @@ class TestGeminiClientExtraction:
         mock_doc.__len__ = lambda self: 1
         mock_doc.__getitem__ = lambda self, idx: mock_page
 
-        # Mock file read for base64 encoding
-        mock_file_content = b"fake image data"
+        # Page image is encoded fully in memory via Pixmap.tobytes
+        mock_pixmap.tobytes.return_value = b"fake image data"
 
         with (
             patch(
@@ -83,11 +83,6 @@ class TestGeminiClientExtraction:
                 return_value=mock_model,
             ),
             patch("fitz.open", return_value=mock_doc),
-            patch.object(mock_pixmap, "save"),
-            patch(
-                "company_research_agent.clients.gemini_client.open",
-                mock_open(read_data=mock_file_content),
-            ),
         ):
             client = GeminiClient(gemini_config)
             result = client.extract_pdf_to_markdown(mock_pdf_path)
@@ -110,8 +105,8 @@ class TestGeminiClientExtraction:
         mock_doc.__len__ = lambda self: 1
         mock_doc.__getitem__ = lambda self, idx: mock_page
 
-        # Mock file read for base64 encoding
-        mock_file_content = b"fake image data"
+        # Page image is encoded fully in memory via Pixmap.tobytes
+        mock_pixmap.tobytes.return_value = b"fake image data"
 
         with (
             patch(
@@ -119,11 +114,6 @@ class TestGeminiClientExtraction:
                 return_value=mock_model,
             ),
             patch("fitz.open", return_value=mock_doc),
-            patch.object(mock_pixmap, "save"),
-            patch(
-                "company_research_agent.clients.gemini_client.open",
-                mock_open(read_data=mock_file_content),
-            ),
         ):
             client = GeminiClient(gemini_config)
             with pytest.raises(GeminiAPIError) as exc_info:
@@ -147,8 +137,8 @@ class TestGeminiClientExtraction:
         mock_doc.__len__ = lambda self: 1
         mock_doc.__getitem__ = lambda self, idx: mock_page
 
-        # Mock file read for base64 encoding
-        mock_file_content = b"fake image data"
+        # Page image is encoded fully in memory via Pixmap.tobytes
+        mock_pixmap.tobytes.return_value = b"fake image data"
 
         with (
             patch(
@@ -156,11 +146,6 @@ class TestGeminiClientExtraction:
                 return_value=mock_model,
             ),
             patch("fitz.open", return_value=mock_doc),
-            patch.object(mock_pixmap, "save"),
-            patch(
-                "company_research_agent.clients.gemini_client.open",
-                mock_open(read_data=mock_file_content),
-            ),
         ):
             client = GeminiClient(gemini_config)
             with pytest.raises(GeminiAPIError) as exc_info:
@@ -169,6 +154,81 @@ class TestGeminiClientExtraction:
         assert "Rate limit exceeded" in str(exc_info.value)
 
 
+class TestGeminiClientModelCaching:
+    """Tests for lazy model construction."""
+
+    def test_model_constructed_once_across_calls(
+        self,
+        gemini_config: GeminiConfig,
+        mock_pdf_path: Path,
+    ) -> None:
+        """The LangChain model should be constructed once and reused."""
+        mock_response = MagicMock()
+        mock_response.content = "text"
+
+        mock_model = MagicMock()
+        mock_model.invoke.return_value = mock_response
+
+        mock_doc = MagicMock()
+        mock_page = MagicMock()
+        mock_pixmap = MagicMock()
+        mock_page.get_pixmap.return_value = mock_pixmap
+        mock_pixmap.tobytes.return_value = b"fake image data"
+        mock_doc.__len__ = lambda self: 1
+        mock_doc.__getitem__ = lambda self, idx: mock_page
+
+        with (
+            patch(
+                "langchain_google_genai.ChatGoogleGenerativeAI",
+                return_value=mock_model,
+            ) as mock_cls,
+            patch("fitz.open", return_value=mock_doc),
+        ):
+            client = GeminiClient(gemini_config)
+            client.extract_pdf_to_markdown(mock_pdf_path)
+            client.extract_pdf_to_markdown(mock_pdf_path)
+
+        assert mock_cls.call_count == 1
+        assert mock_model.invoke.call_count == 2
+
+
+class TestGeminiClientAsyncExtraction:
+    """Tests for GeminiClient concurrent PDF extraction."""
+
+    async def test_extract_pdf_async_preserves_page_order(
+        self,
+        gemini_config: GeminiConfig,
+        mock_pdf_path: Path,
+    ) -> None:
+        """extract_pdf_to_markdown_async should keep pages in document order."""
+        mock_response = MagicMock()
+        mock_response.content = "page text"
+
+        mock_model = MagicMock()
+        mock_model.invoke.return_value = mock_response
+
+        mock_doc = MagicMock()
+        mock_page = MagicMock()
+        mock_pixmap = MagicMock()
+        mock_page.get_pixmap.return_value = mock_pixmap
+        mock_pixmap.tobytes.return_value = b"fake image data"
+        mock_doc.__len__ = lambda self: 3
+        mock_doc.__getitem__ = lambda self, idx: mock_page
+
+        with (
+            patch(
+                "langchain_google_genai.ChatGoogleGenerativeAI",
+                return_value=mock_model,
+            ),
+            patch("fitz.open", return_value=mock_doc),
+        ):
+            client = GeminiClient(gemini_config)
+            result = await client.extract_pdf_to_markdown_async(mock_pdf_path)
+
+        assert result.index("## Page 1") < result.index("## Page 2") < result.index("## Page 3")
+        assert mock_model.invoke.call_count == 3
+
+
 class TestGeminiClientRateLimit:
     """Tests for GeminiClient rate limiting."""
 
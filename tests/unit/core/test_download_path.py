@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from company_research_agent.core.download_path import (
     build_download_path,
     find_document_in_hierarchy,
@@ -65,6 +67,12 @@ class TestParsePeriodToYYYYMM:
 class TestBuildDownloadPath:
     """Tests for build_download_path function."""
 
+    # 期待値のPathはクラス定義時に1回だけパースして再利用する
+    _EXPECTED_FULL = Path(
+        "downloads/72030_トヨタ自動車株式会社/edinet/120_有価証券報告書/202503/S100ABCD.pdf"
+    )
+    _EXPECTED_UNCLASSIFIED = Path("downloads/_unclassified/edinet/S100EFGH.pdf")
+
     def test_full_metadata(self) -> None:
         """Full metadata should create complete path with /edinet/ subfolder."""
         path = build_download_path(
@@ -75,9 +83,7 @@ class TestBuildDownloadPath:
             period_end="2025-03-31",
             doc_id="S100ABCD",
         )
-        assert path == Path(
-            "downloads/72030_トヨタ自動車株式会社/edinet/120_有価証券報告書/202503/S100ABCD.pdf"
-        )
+        assert path == self._EXPECTED_FULL
 
     def test_all_none_uses_unclassified_fallback(self) -> None:
         """All None metadata should use _unclassified fallback path."""
@@ -89,7 +95,7 @@ class TestBuildDownloadPath:
             period_end=None,
             doc_id="S100EFGH",
         )
-        assert path == Path("downloads/_unclassified/edinet/S100EFGH.pdf")
+        assert path == self._EXPECTED_UNCLASSIFIED
         assert path.name == "S100EFGH.pdf"
 
     def test_partial_metadata_uses_unknown(self) -> None:
@@ -119,6 +125,21 @@ class TestBuildDownloadPath:
         assert path.parts[0] == "downloads"
 
 
+# 階層テスト用の相対パスはモジュールロード時に1回だけ組み立てる
+_HIERARCHY_REL = Path("72030_Test") / "120_有報" / "202501" / "S100TEST.pdf"
+
+
+@pytest.fixture(scope="module")
+def hierarchy_root(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """テスト用の階層ディレクトリを1回だけ構築して共有する（読み取り専用）."""
+    root = tmp_path_factory.mktemp("hier")
+    test_file = root / _HIERARCHY_REL
+    test_file.parent.mkdir(parents=True)
+    # 内容は検証対象外のため、エンコード・書き込みを伴わないtouchで作成
+    test_file.touch()
+    return root, test_file
+
+
 class TestFindDocumentInHierarchy:
     """Tests for find_document_in_hierarchy function."""
 
@@ -130,18 +151,16 @@ class TestFindDocumentInHierarchy:
         )
         assert result is None
 
-    def test_find_in_temp_directory(self, tmp_path: Path) -> None:
+    def test_find_in_temp_directory(self, hierarchy_root: tuple[Path, Path]) -> None:
         """Should find document in hierarchy."""
-        # Create test file
-        test_file = tmp_path / "72030_Test" / "120_有報" / "202501" / "S100TEST.pdf"
-        test_file.parent.mkdir(parents=True, exist_ok=True)
-        test_file.write_text("test")
+        root, test_file = hierarchy_root
 
-        result = find_document_in_hierarchy(tmp_path, "S100TEST")
+        result = find_document_in_hierarchy(root, "S100TEST")
         assert result is not None
         assert result == test_file
 
-    def test_not_found_returns_none(self, tmp_path: Path) -> None:
+    def test_not_found_returns_none(self, hierarchy_root: tuple[Path, Path]) -> None:
         """Non-existent document should return None."""
-        result = find_document_in_hierarchy(tmp_path, "S100NOTFOUND")
+        root, _ = hierarchy_root
+        result = find_document_in_hierarchy(root, "S100NOTFOUND")
         assert result is None
@@ -25,40 +25,35 @@ class TestCompanyResearchAgentError:
         assert str(error) == "test message"
 
 
+@pytest.fixture
+def api_error() -> EDINETAPIError:
+    """代表的なEDINETAPIErrorインスタンス（テスト側で変更しないこと）."""
+    return EDINETAPIError(
+        status_code=400,
+        message="Bad Request",
+        endpoint="/documents.json",
+    )
+
+
 class TestEDINETAPIError:
     """Tests for EDINETAPIError class."""
 
-    def test_attributes(self) -> None:
+    def test_attributes(self, api_error: EDINETAPIError) -> None:
         """EDINETAPIError should store status_code, message, and endpoint."""
-        error = EDINETAPIError(
-            status_code=400,
-            message="Bad Request",
-            endpoint="/documents.json",
-        )
-        assert error.status_code == 400
-        assert error.message == "Bad Request"
-        assert error.endpoint == "/documents.json"
+        assert api_error.status_code == 400
+        assert api_error.message == "Bad Request"
+        assert api_error.endpoint == "/documents.json"
 
-    def test_str_representation(self) -> None:
+    def test_str_representation(self, api_error: EDINETAPIError) -> None:
         """EDINETAPIError should have informative string representation."""
-        error = EDINETAPIError(
-            status_code=400,
-            message="Bad Request",
-            endpoint="/documents.json",
-        )
-        error_str = str(error)
+        error_str = str(api_error)
         assert "400" in error_str
         assert "Bad Request" in error_str
         assert "/documents.json" in error_str
 
-    def test_is_company_research_agent_error(self) -> None:
+    def test_is_company_research_agent_error(self, api_error: EDINETAPIError) -> None:
         """EDINETAPIError should be a CompanyResearchAgentError."""
-        error = EDINETAPIError(
-            status_code=400,
-            message="Bad Request",
-            endpoint="/test",
-        )
-        assert isinstance(error, CompanyResearchAgentError)
+        assert isinstance(api_error, CompanyResearchAgentError)
 
 
 class TestEDINETAuthenticationError:
@@ -122,15 +117,15 @@ class TestEDINETServerError:
         assert isinstance(error, EDINETAPIError)
         assert isinstance(error, CompanyResearchAgentError)
 
-    def test_various_5xx_codes(self) -> None:
+    @pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+    def test_various_5xx_codes(self, status_code: int) -> None:
         """EDINETServerError should handle various 5xx status codes."""
-        for status_code in [500, 502, 503, 504]:
-            error = EDINETServerError(
-                status_code=status_code,
-                message=f"Server error {status_code}",
-                endpoint="/test",
-            )
-            assert error.status_code == status_code
+        error = EDINETServerError(
+            status_code=status_code,
+            message=f"Server error {status_code}",
+            endpoint="/test",
+        )
+        assert error.status_code == status_code
 
     def test_can_be_caught_for_retry(self) -> None:
         """EDINETServerError should be catchable for retry logic."""
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from io import StringIO
 
 import pytest
 from rich.console import Console
+from rich.progress import Progress, SpinnerColumn
 
+from company_research_agent.core import progress as progress_module
 from company_research_agent.core.progress import (
     console,
     create_progress,
@@ -21,149 +24,68 @@ from company_research_agent.core.progress import (
 )
 
 
-class TestPrintFunctions:
-    """Tests for print_* functions."""
+@pytest.fixture
+def patched_console(monkeypatch: pytest.MonkeyPatch) -> StringIO:
+    """progress.consoleをStringIOへ出力するConsoleに差し替える.
 
-    def test_print_status_outputs_message(self) -> None:
-        """print_status should output message with blue arrow icon."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
-
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            print_status("検索中")
-            result = output.getvalue()
-            assert "検索中" in result
-            assert "▶" in result  # Blue arrow icon
-        finally:
-            progress.console = original_console
-
-    def test_print_success_outputs_message(self) -> None:
-        """print_success should output message with green checkmark icon."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
-
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            print_success("ダウンロード完了")
-            result = output.getvalue()
-            assert "ダウンロード完了" in result
-        finally:
-            progress.console = original_console
-
-    def test_print_error_outputs_message(self) -> None:
-        """print_error should output message with red cross icon."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
-
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            print_error("ファイルが見つかりません")
-            result = output.getvalue()
-            assert "ファイルが見つかりません" in result
-        finally:
-            progress.console = original_console
-
-    def test_print_warning_outputs_message(self) -> None:
-        """print_warning should output message with yellow warning icon."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
-
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            print_warning("キャッシュが古い可能性があります")
-            result = output.getvalue()
-            assert "キャッシュが古い可能性があります" in result
-        finally:
-            progress.console = original_console
-
-    def test_print_info_outputs_message(self) -> None:
-        """print_info should output message with cyan info icon."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
-
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            print_info("3件の書類が見つかりました")
-            result = output.getvalue()
-            assert "3件の書類が見つかりました" in result
-        finally:
-            progress.console = original_console
-
-    def test_print_node_start_outputs_message(self) -> None:
-        """print_node_start should output node name with dimmed arrow."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
+    color_system=Noneと明示的なwidthで、Console構築時の端末能力
+    検出（環境変数・端末サイズの参照）をスキップする。
+    復元はmonkeypatchが自動で行う。
+    """
+    output = StringIO()
+    test_console = Console(file=output, force_terminal=True, width=80, color_system=None)
+    monkeypatch.setattr(progress_module, "console", test_console)
+    return output
 
-        from company_research_agent.core import progress
 
-        original_console = progress.console
-        progress.console = test_console
+class TestPrintFunctions:
+    """Tests for print_* functions."""
 
-        try:
-            print_node_start("edinet")
-            result = output.getvalue()
-            assert "edinet" in result
-            assert "実行中" in result
-            assert "▷" in result  # Dimmed arrow icon
-        finally:
-            progress.console = original_console
+    @pytest.mark.parametrize(
+        ("print_fn", "message", "icon"),
+        [
+            (print_status, "検索中", "▶"),  # Blue arrow icon
+            (print_success, "ダウンロード完了", None),
+            (print_error, "ファイルが見つかりません", None),
+            (print_warning, "キャッシュが古い可能性があります", None),
+            (print_info, "3件の書類が見つかりました", None),
+        ],
+    )
+    def test_print_functions_output_message(
+        self,
+        patched_console: StringIO,
+        print_fn: Callable[[str], None],
+        message: str,
+        icon: str | None,
+    ) -> None:
+        """Each print_* function should output its message (and icon if any)."""
+        print_fn(message)
+        result = patched_console.getvalue()
+        assert message in result
+        if icon is not None:
+            assert icon in result
+
+    def test_print_node_start_outputs_message(self, patched_console: StringIO) -> None:
+        """print_node_start should output node name with dimmed arrow."""
+        print_node_start("edinet")
+        result = patched_console.getvalue()
+        assert "edinet" in result
+        assert "実行中" in result
+        assert "▷" in result  # Dimmed arrow icon
 
-    def test_print_node_complete_success_outputs_message(self) -> None:
+    def test_print_node_complete_success_outputs_message(self, patched_console: StringIO) -> None:
         """print_node_complete should output success message with green checkmark."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
+        print_node_complete("pdf_parse", success=True)
+        result = patched_console.getvalue()
+        assert "pdf_parse" in result
+        assert "完了" in result
 
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            print_node_complete("pdf_parse", success=True)
-            result = output.getvalue()
-            assert "pdf_parse" in result
-            assert "完了" in result
-        finally:
-            progress.console = original_console
-
-    def test_print_node_complete_failure_outputs_message(self) -> None:
+    def test_print_node_complete_failure_outputs_message(self, patched_console: StringIO) -> None:
         """print_node_complete should output failure message with red cross."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
-
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            print_node_complete("business_summary", success=False)
-            result = output.getvalue()
-            assert "business_summary" in result
-            assert "失敗" in result
-        finally:
-            progress.console = original_console
+        print_node_complete("business_summary", success=False)
+        result = patched_console.getvalue()
+        assert "business_summary" in result
+        assert "失敗" in result
 
 
 class TestCreateProgress:
@@ -171,15 +93,11 @@ class TestCreateProgress:
 
     def test_create_progress_returns_progress_instance(self) -> None:
         """create_progress should return a Progress instance."""
-        from rich.progress import Progress
-
         progress = create_progress()
         assert isinstance(progress, Progress)
 
     def test_create_progress_has_spinner_column(self) -> None:
         """create_progress should include SpinnerColumn."""
-        from rich.progress import SpinnerColumn
-
         progress = create_progress()
         column_types = [type(col) for col in progress.columns]
         assert SpinnerColumn in column_types
@@ -195,46 +113,26 @@ class TestCreateProgress:
 class TestProgressContext:
     """Tests for progress_context context manager."""
 
-    def test_progress_context_prints_status_and_success_on_completion(self) -> None:
+    def test_progress_context_prints_status_and_success_on_completion(
+        self, patched_console: StringIO
+    ) -> None:
         """progress_context should print status on entry and success on exit."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
+        with progress_context("データ処理中"):
+            pass  # Simulate work
 
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            with progress_context("データ処理中"):
-                pass  # Simulate work
+        result = patched_console.getvalue()
+        assert "データ処理中" in result
+        assert "完了" in result
 
-            result = output.getvalue()
-            assert "データ処理中" in result
-            assert "完了" in result
-        finally:
-            progress.console = original_console
-
-    def test_progress_context_prints_error_on_exception(self) -> None:
+    def test_progress_context_prints_error_on_exception(self, patched_console: StringIO) -> None:
         """progress_context should print error message when exception occurs."""
-        output = StringIO()
-        test_console = Console(file=output, force_terminal=True)
-
-        from company_research_agent.core import progress
-
-        original_console = progress.console
-        progress.console = test_console
-
-        try:
-            with pytest.raises(ValueError):  # noqa: PT011
-                with progress_context("データ処理中"):
-                    raise ValueError("テストエラー")
+        with pytest.raises(ValueError):  # noqa: PT011
+            with progress_context("データ処理中"):
+                raise ValueError("テストエラー")
 
-            result = output.getvalue()
-            assert "データ処理中" in result
-            assert "失敗" in result
-        finally:
-            progress.console = original_console
+        result = patched_console.getvalue()
+        assert "データ処理中" in result
+        assert "失敗" in result
 
     def test_progress_context_re_raises_exception(self) -> None:
         """progress_context should re-raise the original exception."""
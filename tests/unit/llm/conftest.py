@@ -0,0 +1,115 @@
+"""LLMユニットテスト共通のフィクスチャ."""
+
+# mypy: disable-error-code="call-arg"
+
+from __future__ import annotations
+
+import functools
+import os
+import sys
+import types
+from collections.abc import Callable, Generator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pydantic_settings import SettingsConfigDict
+
+from company_research_agent.llm.config import LLMConfig
+
+
+class _TestLLMConfig(LLMConfig):
+    """テスト用に構築を軽量化したLLMConfig.
+
+    .envファイルの探索・読み込みとsecrets_dirの走査を無効化し、
+    環境変数キーの照合を大文字小文字厳密にすることで、
+    インスタンス化ごとのファイルシステムアクセスと走査を省く。
+    フィールド定義・検証は本体と完全に同一。
+    """
+
+    model_config = SettingsConfigDict(
+        env_file=None,
+        secrets_dir=None,
+        extra="ignore",
+        case_sensitive=True,
+    )
+
+
+@functools.cache
+def _build_llm_config(env_items: frozenset[tuple[str, str]]) -> LLMConfig:
+    """指定の環境変数セットに相当するLLMConfigを構築する（同一セットでメモ化）.
+
+    値は環境変数エイリアス名のままinitキーワード引数として直接注入し、
+    os.environへの書き込みと環境変数ソースの再走査を避ける。
+    clear=Trueの空patch.dictは、実行環境に残るLLM_*等の変数が
+    未指定フィールドのデフォルト検証に漏れ込むのを防ぐためだけに使う。
+    """
+    with patch.dict(os.environ, {}, clear=True):
+        return _TestLLMConfig(**dict(env_items))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _clean_env_per_module() -> Generator[None, None, None]:
+    """環境変数をモジュール単位でスナップショットしてクリアする.
+
+    テストごとにpatch.dict(clear=True)でos.environ全体を複製・復元する
+    代わりに、モジュールの先頭で1回だけ退避・クリアし終了時に戻す。
+    テスト内の個別設定はmonkeypatch.setenvが各テスト後に巻き戻すため、
+    テスト間は常に空の環境から始まる。
+    """
+    saved = os.environ.copy()
+    os.environ.clear()
+    yield
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture
+def stub_chat_model(monkeypatch: pytest.MonkeyPatch) -> Callable[[str], MagicMock]:
+    """langchain_*モジュールをスタブに差し替え、ChatModelクラスのモックを返す.
+
+    patch()と異なり本物のパッケージをインポートしないため、
+    未ロードのlangchain系依存ツリーの読み込みを丸ごと回避できる。
+    monkeypatch経由のためsys.modulesはテスト終了時に復元される。
+    """
+
+    def stub(target: str) -> MagicMock:
+        module_name, attr = target.rsplit(".", 1)
+        mock_cls = MagicMock(return_value=MagicMock())
+        module = types.ModuleType(module_name)
+        setattr(module, attr, mock_cls)
+        monkeypatch.setitem(sys.modules, module_name, module)
+        return mock_cls
+
+    return stub
+
+
+@pytest.fixture(scope="session")
+def make_llm_config() -> Callable[[dict[str, str] | None], LLMConfig]:
+    """環境変数セットからLLMConfigを取得するファクトリを返す.
+
+    LLMConfigは構築後に変更しないため、同一の環境変数セットに対する
+    pydantic-settingsのソース走査とバリデーションを1回に抑える。
+    返されるインスタンスは共有されるので読み取り専用として扱うこと。
+    """
+
+    def factory(env: dict[str, str] | None = None) -> LLMConfig:
+        return _build_llm_config(frozenset((env or {}).items()))
+
+    return factory
+
+
+@pytest.fixture(scope="session")
+def fast_llm_config() -> Callable[..., LLMConfig]:
+    """検証をスキップしてフィールド値を直接設定するファクトリを返す.
+
+    model_constructは型強制・バリデータを一切走らせないため、
+    既知のフィールド値を前提にメソッドのロジックだけを検証する
+    テスト向け。環境変数の解釈自体が主題のテストでは
+    make_llm_configを使うこと。
+    """
+    defaults = _build_llm_config(frozenset()).model_dump()
+
+    def factory(**fields: object) -> LLMConfig:
+        return LLMConfig.model_construct(**{**defaults, **fields})
+
+    return factory
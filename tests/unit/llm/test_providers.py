@@ -2,9 +2,8 @@
 
 # mypy: disable-error-code="call-arg"
 
-import os
-from collections.abc import Generator
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import Callable
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from pydantic import BaseModel
@@ -16,12 +15,8 @@ from company_research_agent.llm.providers.google import GoogleProvider
 from company_research_agent.llm.providers.ollama import OllamaProvider
 from company_research_agent.llm.providers.openai import OpenAIProvider
 
-
-@pytest.fixture(autouse=True)
-def clean_env() -> Generator[None, None, None]:
-    """テスト前に環境変数をクリア."""
-    with patch.dict(os.environ, {}, clear=True):
-        yield
+# conftestのmake_llm_configフィクスチャの型エイリアス
+ConfigFactory = Callable[[dict[str, str] | None], LLMConfig]
 
 
 class SampleOutput(BaseModel):
@@ -30,199 +25,144 @@ class SampleOutput(BaseModel):
     content: str
 
 
-# =============================================================================
-# GoogleProvider Tests
-# =============================================================================
-
-
-class TestGoogleProvider:
-    """GoogleProviderのテスト."""
-
-    def test_provider_name(self) -> None:
-        """プロバイダー名が正しいことを確認."""
-        env_vars = {"LLM_PROVIDER": "google", "GOOGLE_API_KEY": "test-key"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = GoogleProvider(config)
-            assert provider.provider_name == "google"
-
-    def test_default_model_name(self) -> None:
-        """デフォルトモデル名が正しいことを確認."""
-        env_vars = {"LLM_PROVIDER": "google", "GOOGLE_API_KEY": "test-key"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = GoogleProvider(config)
-            assert provider.model_name == GoogleProvider.DEFAULT_MODEL
-
-    def test_custom_model_name(self) -> None:
-        """カスタムモデル名が正しく設定されることを確認."""
-        env_vars = {
-            "LLM_PROVIDER": "google",
-            "GOOGLE_API_KEY": "test-key",
-            "LLM_MODEL": "gemini-1.5-pro",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = GoogleProvider(config)
-            assert provider.model_name == "gemini-1.5-pro"
-
-    def test_supports_vision(self) -> None:
-        """ビジョンサポートがTrueであることを確認."""
-        env_vars = {"LLM_PROVIDER": "google", "GOOGLE_API_KEY": "test-key"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = GoogleProvider(config)
-            assert provider.supports_vision is True
-
-    def test_create_model_without_api_key_raises_error(self) -> None:
-        """APIキーなしでモデル作成時にエラーが発生することを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "google"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = GoogleProvider(config)
-            with pytest.raises(LLMProviderError, match="Google API key is required"):
-                provider.get_model()
-
-    def test_create_model_with_api_key(self) -> None:
-        """APIキーありでモデルが作成されることを確認."""
-        env_vars = {"LLM_PROVIDER": "google", "GOOGLE_API_KEY": "test-key"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_chat:
-                mock_chat.return_value = MagicMock()
-                config = LLMConfig(_env_file=None)
-                provider = GoogleProvider(config)
-                model = provider.get_model()
-                assert model is not None
-                mock_chat.assert_called_once()
-
-
-# =============================================================================
-# OpenAIProvider Tests
-# =============================================================================
-
-
-class TestOpenAIProvider:
-    """OpenAIProviderのテスト."""
-
-    def test_provider_name(self) -> None:
-        """プロバイダー名が正しいことを確認."""
-        env_vars = {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "sk-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OpenAIProvider(config)
-            assert provider.provider_name == "openai"
-
-    def test_default_model_name(self) -> None:
-        """デフォルトモデル名が正しいことを確認."""
-        env_vars = {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "sk-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OpenAIProvider(config)
-            assert provider.model_name == OpenAIProvider.DEFAULT_MODEL
-
-    def test_custom_model_name(self) -> None:
-        """カスタムモデル名が正しく設定されることを確認."""
-        env_vars = {
-            "LLM_PROVIDER": "openai",
-            "OPENAI_API_KEY": "sk-test",
-            "LLM_MODEL": "gpt-4o-mini",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OpenAIProvider(config)
-            assert provider.model_name == "gpt-4o-mini"
-
-    def test_supports_vision(self) -> None:
-        """ビジョンサポートがTrueであることを確認."""
-        env_vars = {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "sk-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OpenAIProvider(config)
-            assert provider.supports_vision is True
+# 構造化出力の期待値はモジュールロード時に1回だけ構築する（読み取り専用）
+_SAMPLE_RESULT = SampleOutput(content="test")
 
-    def test_create_model_without_api_key_raises_error(self) -> None:
-        """APIキーなしでモデル作成時にエラーが発生することを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "openai"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OpenAIProvider(config)
-            with pytest.raises(LLMProviderError, match="OpenAI API key is required"):
-                provider.get_model()
 
-    def test_create_model_with_api_key(self) -> None:
-        """APIキーありでモデルが作成されることを確認."""
-        env_vars = {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "sk-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch("langchain_openai.ChatOpenAI") as mock_chat:
-                mock_chat.return_value = MagicMock()
-                config = LLMConfig(_env_file=None)
-                provider = OpenAIProvider(config)
-                model = provider.get_model()
-                assert model is not None
-                mock_chat.assert_called_once()
+def _structured_model_mock(result: object = None, error: Exception | None = None) -> MagicMock:
+    """with_structured_output()呼び出しに応答するChatModelモックを構築する."""
+    mock_model = MagicMock()
+    mock_structured = MagicMock()
+    if error is not None:
+        mock_structured.ainvoke = AsyncMock(side_effect=error)
+    else:
+        mock_structured.ainvoke = AsyncMock(return_value=result)
+    mock_model.with_structured_output.return_value = mock_structured
+    return mock_model
 
 
 # =============================================================================
-# AnthropicProvider Tests
+# APIキー必須プロバイダー (Google / OpenAI / Anthropic) の共通契約テスト
 # =============================================================================
 
-
-class TestAnthropicProvider:
-    """AnthropicProviderのテスト."""
-
-    def test_provider_name(self) -> None:
+# (プロバイダークラス, 環境変数セット, カスタムモデル名, キー欠如時のエラー, patchターゲット)
+_API_KEY_PROVIDERS = [
+    pytest.param(
+        GoogleProvider,
+        {"LLM_PROVIDER": "google", "GOOGLE_API_KEY": "test-key"},
+        "gemini-1.5-pro",
+        "Google API key is required",
+        "langchain_google_genai.ChatGoogleGenerativeAI",
+        id="google",
+    ),
+    pytest.param(
+        OpenAIProvider,
+        {"LLM_PROVIDER": "openai", "OPENAI_API_KEY": "sk-test"},
+        "gpt-4o-mini",
+        "OpenAI API key is required",
+        "langchain_openai.ChatOpenAI",
+        id="openai",
+    ),
+    pytest.param(
+        AnthropicProvider,
+        {"LLM_PROVIDER": "anthropic", "ANTHROPIC_API_KEY": "sk-ant-test"},
+        "claude-3-haiku-20240307",
+        "Anthropic API key is required",
+        "langchain_anthropic.ChatAnthropic",
+        id="anthropic",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "provider_cls,env_vars,custom_model,missing_key_error,patch_target",
+    _API_KEY_PROVIDERS,
+)
+class TestAPIKeyProviders:
+    """APIキー必須プロバイダー共通のテスト."""
+
+    def test_provider_name(
+        self,
+        make_llm_config: ConfigFactory,
+        provider_cls: type,
+        env_vars: dict[str, str],
+        custom_model: str,
+        missing_key_error: str,
+        patch_target: str,
+    ) -> None:
         """プロバイダー名が正しいことを確認."""
-        env_vars = {"LLM_PROVIDER": "anthropic", "ANTHROPIC_API_KEY": "sk-ant-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = AnthropicProvider(config)
-            assert provider.provider_name == "anthropic"
-
-    def test_default_model_name(self) -> None:
+        provider = provider_cls(make_llm_config(env_vars))
+        assert provider.provider_name == env_vars["LLM_PROVIDER"]
+
+    def test_default_model_name(
+        self,
+        make_llm_config: ConfigFactory,
+        provider_cls: type,
+        env_vars: dict[str, str],
+        custom_model: str,
+        missing_key_error: str,
+        patch_target: str,
+    ) -> None:
         """デフォルトモデル名が正しいことを確認."""
-        env_vars = {"LLM_PROVIDER": "anthropic", "ANTHROPIC_API_KEY": "sk-ant-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = AnthropicProvider(config)
-            assert provider.model_name == AnthropicProvider.DEFAULT_MODEL
-
-    def test_custom_model_name(self) -> None:
+        provider = provider_cls(make_llm_config(env_vars))
+        assert provider.model_name == provider_cls.DEFAULT_MODEL
+
+    def test_custom_model_name(
+        self,
+        make_llm_config: ConfigFactory,
+        provider_cls: type,
+        env_vars: dict[str, str],
+        custom_model: str,
+        missing_key_error: str,
+        patch_target: str,
+    ) -> None:
         """カスタムモデル名が正しく設定されることを確認."""
-        env_vars = {
-            "LLM_PROVIDER": "anthropic",
-            "ANTHROPIC_API_KEY": "sk-ant-test",
-            "LLM_MODEL": "claude-3-haiku-20240307",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = AnthropicProvider(config)
-            assert provider.model_name == "claude-3-haiku-20240307"
-
-    def test_supports_vision(self) -> None:
+        provider = provider_cls(make_llm_config({**env_vars, "LLM_MODEL": custom_model}))
+        assert provider.model_name == custom_model
+
+    def test_supports_vision(
+        self,
+        make_llm_config: ConfigFactory,
+        provider_cls: type,
+        env_vars: dict[str, str],
+        custom_model: str,
+        missing_key_error: str,
+        patch_target: str,
+    ) -> None:
         """ビジョンサポートがTrueであることを確認."""
-        env_vars = {"LLM_PROVIDER": "anthropic", "ANTHROPIC_API_KEY": "sk-ant-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = AnthropicProvider(config)
-            assert provider.supports_vision is True
-
-    def test_create_model_without_api_key_raises_error(self) -> None:
+        provider = provider_cls(make_llm_config(env_vars))
+        assert provider.supports_vision is True
+
+    def test_create_model_without_api_key_raises_error(
+        self,
+        make_llm_config: ConfigFactory,
+        provider_cls: type,
+        env_vars: dict[str, str],
+        custom_model: str,
+        missing_key_error: str,
+        patch_target: str,
+    ) -> None:
         """APIキーなしでモデル作成時にエラーが発生することを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "anthropic"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = AnthropicProvider(config)
-            with pytest.raises(LLMProviderError, match="Anthropic API key is required"):
-                provider.get_model()
-
-    def test_create_model_with_api_key(self) -> None:
+        provider = provider_cls(make_llm_config({"LLM_PROVIDER": env_vars["LLM_PROVIDER"]}))
+        with pytest.raises(LLMProviderError, match=missing_key_error):
+            provider.get_model()
+
+    def test_create_model_with_api_key(
+        self,
+        make_llm_config: ConfigFactory,
+        stub_chat_model: Callable[[str], MagicMock],
+        provider_cls: type,
+        env_vars: dict[str, str],
+        custom_model: str,
+        missing_key_error: str,
+        patch_target: str,
+    ) -> None:
         """APIキーありでモデルが作成されることを確認."""
-        env_vars = {"LLM_PROVIDER": "anthropic", "ANTHROPIC_API_KEY": "sk-ant-test"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            with patch("langchain_anthropic.ChatAnthropic") as mock_chat:
-                mock_chat.return_value = MagicMock()
-                config = LLMConfig(_env_file=None)
-                provider = AnthropicProvider(config)
-                model = provider.get_model()
-                assert model is not None
-                mock_chat.assert_called_once()
+        mock_chat = stub_chat_model(patch_target)
+        provider = provider_cls(make_llm_config(env_vars))
+        model = provider.get_model()
+        assert model is not None
+        mock_chat.assert_called_once()
 
 
 # =============================================================================
@@ -233,34 +173,26 @@ class TestAnthropicProvider:
 class TestOllamaProvider:
     """OllamaProviderのテスト."""
 
-    def test_provider_name(self) -> None:
+    def test_provider_name(self, make_llm_config: ConfigFactory) -> None:
         """プロバイダー名が正しいことを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-            assert provider.provider_name == "ollama"
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
+        assert provider.provider_name == "ollama"
 
-    def test_default_model_name(self) -> None:
+    def test_default_model_name(self, make_llm_config: ConfigFactory) -> None:
         """デフォルトモデル名が正しいことを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-            assert provider.model_name == OllamaProvider.DEFAULT_MODEL
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
+        assert provider.model_name == OllamaProvider.DEFAULT_MODEL
 
-    def test_custom_model_name(self) -> None:
+    def test_custom_model_name(self, make_llm_config: ConfigFactory) -> None:
         """カスタムモデル名が正しく設定されることを確認."""
-        env_vars = {"LLM_PROVIDER": "ollama", "LLM_MODEL": "gpt-oss-20b"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-            assert provider.model_name == "gpt-oss-20b"
+        config = make_llm_config({"LLM_PROVIDER": "ollama", "LLM_MODEL": "gpt-oss-20b"})
+        provider = OllamaProvider(config)
+        assert provider.model_name == "gpt-oss-20b"
 
-    def test_no_api_key_required(self) -> None:
+    def test_no_api_key_required(self, make_llm_config: ConfigFactory) -> None:
         """APIキーなしでプロバイダーが作成できることを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-            assert provider is not None
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
+        assert provider is not None
 
     @pytest.mark.parametrize(
         "model_name,expected_vision",
@@ -277,35 +209,31 @@ class TestOllamaProvider:
             ("moondream2", True),
         ],
     )
-    def test_supports_vision_based_on_model(self, model_name: str, expected_vision: bool) -> None:
+    def test_supports_vision_based_on_model(
+        self, make_llm_config: ConfigFactory, model_name: str, expected_vision: bool
+    ) -> None:
         """モデル名に基づいてビジョンサポートが判定されることを確認."""
-        env_vars = {"LLM_PROVIDER": "ollama", "LLM_MODEL": model_name}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-            assert provider.supports_vision is expected_vision
+        config = make_llm_config({"LLM_PROVIDER": "ollama", "LLM_MODEL": model_name})
+        provider = OllamaProvider(config)
+        assert provider.supports_vision is expected_vision
 
-    def test_create_model(self) -> None:
+    def test_create_model(
+        self, make_llm_config: ConfigFactory, stub_chat_model: Callable[[str], MagicMock]
+    ) -> None:
         """モデルが作成されることを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            with patch("langchain_ollama.ChatOllama") as mock_chat:
-                mock_chat.return_value = MagicMock()
-                config = LLMConfig(_env_file=None)
-                provider = OllamaProvider(config)
-                model = provider.get_model()
-                assert model is not None
-                mock_chat.assert_called_once()
-
-    def test_custom_base_url(self) -> None:
+        mock_chat = stub_chat_model("langchain_ollama.ChatOllama")
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
+        model = provider.get_model()
+        assert model is not None
+        mock_chat.assert_called_once()
+
+    def test_custom_base_url(self, make_llm_config: ConfigFactory) -> None:
         """カスタムベースURLが設定されることを確認."""
-        env_vars = {
-            "LLM_PROVIDER": "ollama",
-            "OLLAMA_BASE_URL": "http://custom-server:11434",
-        }
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-            assert provider._config.ollama_base_url == "http://custom-server:11434"
+        config = make_llm_config(
+            {"LLM_PROVIDER": "ollama", "OLLAMA_BASE_URL": "http://custom-server:11434"}
+        )
+        provider = OllamaProvider(config)
+        assert provider._config.ollama_base_url == "http://custom-server:11434"
 
 
 # =============================================================================
@@ -316,93 +244,80 @@ class TestOllamaProvider:
 class TestBaseLLMProviderMethods:
     """BaseLLMProviderの共通メソッドテスト."""
 
-    def test_lazy_model_initialization(self) -> None:
+    def test_lazy_model_initialization(self, make_llm_config: ConfigFactory) -> None:
         """モデルが遅延初期化されることを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-            # 内部モデルはNone
-            assert provider._model is None
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
+        # 内部モデルはNone
+        assert provider._model is None
 
-    def test_model_cached_after_first_call(self) -> None:
+    def test_model_cached_after_first_call(
+        self, make_llm_config: ConfigFactory, stub_chat_model: Callable[[str], MagicMock]
+    ) -> None:
         """get_model()が2回目以降はキャッシュを使用することを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            with patch("langchain_ollama.ChatOllama") as mock_chat:
-                mock_chat.return_value = MagicMock()
-                config = LLMConfig(_env_file=None)
-                provider = OllamaProvider(config)
+        mock_chat = stub_chat_model("langchain_ollama.ChatOllama")
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
 
-                model1 = provider.get_model()
-                model2 = provider.get_model()
+        model1 = provider.get_model()
+        model2 = provider.get_model()
 
-                assert model1 is model2
-                mock_chat.assert_called_once()
+        assert model1 is model2
+        mock_chat.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_ainvoke_structured_success(self) -> None:
+    async def test_ainvoke_structured_success(
+        self, make_llm_config: ConfigFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """ainvoke_structured()が正常に動作することを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-
-            mock_model = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(return_value=SampleOutput(content="test"))
-            mock_model.with_structured_output.return_value = mock_structured
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
+        mock_model = _structured_model_mock(result=_SAMPLE_RESULT)
 
-            with patch.object(provider, "get_model", return_value=mock_model):
-                result = await provider.ainvoke_structured("test prompt", SampleOutput)
+        monkeypatch.setattr(provider, "get_model", lambda: mock_model)
+        result = await provider.ainvoke_structured("test prompt", SampleOutput)
 
-            assert result.content == "test"
-            mock_model.with_structured_output.assert_called_once_with(SampleOutput)
+        assert result.content == "test"
+        mock_model.with_structured_output.assert_called_once_with(SampleOutput)
 
     @pytest.mark.asyncio
-    async def test_ainvoke_structured_error_handling(self) -> None:
+    async def test_ainvoke_structured_error_handling(
+        self, make_llm_config: ConfigFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """ainvoke_structured()のエラーがLLMProviderErrorでラップされることを確認."""
-        with patch.dict(os.environ, {"LLM_PROVIDER": "ollama"}, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
-
-            mock_model = MagicMock()
-            mock_structured = MagicMock()
-            mock_structured.ainvoke = AsyncMock(side_effect=Exception("API error"))
-            mock_model.with_structured_output.return_value = mock_structured
+        provider = OllamaProvider(make_llm_config({"LLM_PROVIDER": "ollama"}))
+        mock_model = _structured_model_mock(error=Exception("API error"))
 
-            with patch.object(provider, "get_model", return_value=mock_model):
-                with pytest.raises(LLMProviderError) as exc_info:
-                    await provider.ainvoke_structured("test prompt", SampleOutput)
+        monkeypatch.setattr(provider, "get_model", lambda: mock_model)
+        with pytest.raises(LLMProviderError) as exc_info:
+            await provider.ainvoke_structured("test prompt", SampleOutput)
 
-            assert exc_info.value.provider == "ollama"
-            assert "API error" in str(exc_info.value)
+        assert exc_info.value.provider == "ollama"
+        assert "API error" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_ainvoke_vision_not_supported(self) -> None:
+    async def test_ainvoke_vision_not_supported(self, make_llm_config: ConfigFactory) -> None:
         """ビジョン非対応モデルでainvoke_vision()がエラーを発生させることを確認."""
-        env_vars = {"LLM_PROVIDER": "ollama", "LLM_MODEL": "llama3.2"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
+        config = make_llm_config({"LLM_PROVIDER": "ollama", "LLM_MODEL": "llama3.2"})
+        provider = OllamaProvider(config)
 
-            with pytest.raises(LLMProviderError, match="Vision not supported"):
-                await provider.ainvoke_vision("describe image", b"fake_image_data")
+        with pytest.raises(LLMProviderError, match="Vision not supported"):
+            await provider.ainvoke_vision("describe image", b"fake_image_data")
 
     @pytest.mark.asyncio
-    async def test_ainvoke_vision_success(self) -> None:
+    async def test_ainvoke_vision_success(
+        self, make_llm_config: ConfigFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """ainvoke_vision()が正常に動作することを確認."""
-        env_vars = {"LLM_PROVIDER": "ollama", "LLM_MODEL": "llava"}
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = OllamaProvider(config)
+        config = make_llm_config({"LLM_PROVIDER": "ollama", "LLM_MODEL": "llava"})
+        provider = OllamaProvider(config)
 
-            mock_model = MagicMock()
-            mock_response = MagicMock()
-            mock_response.content = "Image description"
-            mock_model.ainvoke = AsyncMock(return_value=mock_response)
+        mock_model = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = "Image description"
+        mock_model.ainvoke = AsyncMock(return_value=mock_response)
 
-            with patch.object(provider, "get_model", return_value=mock_model):
-                result = await provider.ainvoke_vision("describe image", b"fake_image_data")
+        monkeypatch.setattr(provider, "get_model", lambda: mock_model)
+        result = await provider.ainvoke_vision("describe image", b"fake_image_data")
 
-            assert result == "Image description"
+        assert result == "Image description"
 
 
 # =============================================================================
@@ -423,14 +338,12 @@ class TestAllProvidersCommonBehavior:
         ],
     )
     def test_all_providers_have_provider_name(
-        self, provider_class: type, env_vars: dict[str, str]
+        self, make_llm_config: ConfigFactory, provider_class: type, env_vars: dict[str, str]
     ) -> None:
         """全プロバイダーがprovider_nameを持つことを確認."""
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = provider_class(config)
-            assert provider.provider_name is not None
-            assert isinstance(provider.provider_name, str)
+        provider = provider_class(make_llm_config(env_vars))
+        assert provider.provider_name is not None
+        assert isinstance(provider.provider_name, str)
 
     @pytest.mark.parametrize(
         "provider_class,env_vars",
@@ -442,14 +355,12 @@ class TestAllProvidersCommonBehavior:
         ],
     )
     def test_all_providers_have_model_name(
-        self, provider_class: type, env_vars: dict[str, str]
+        self, make_llm_config: ConfigFactory, provider_class: type, env_vars: dict[str, str]
     ) -> None:
         """全プロバイダーがmodel_nameを持つことを確認."""
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = provider_class(config)
-            assert provider.model_name is not None
-            assert isinstance(provider.model_name, str)
+        provider = provider_class(make_llm_config(env_vars))
+        assert provider.model_name is not None
+        assert isinstance(provider.model_name, str)
 
     @pytest.mark.parametrize(
         "provider_class,env_vars",
@@ -461,10 +372,8 @@ class TestAllProvidersCommonBehavior:
         ],
     )
     def test_all_providers_have_supports_vision(
-        self, provider_class: type, env_vars: dict[str, str]
+        self, make_llm_config: ConfigFactory, provider_class: type, env_vars: dict[str, str]
     ) -> None:
         """全プロバイダーがsupports_visionを持つことを確認."""
-        with patch.dict(os.environ, env_vars, clear=True):
-            config = LLMConfig(_env_file=None)
-            provider = provider_class(config)
-            assert isinstance(provider.supports_vision, bool)
+        provider = provider_class(make_llm_config(env_vars))
+        assert isinstance(provider.supports_vision, bool)
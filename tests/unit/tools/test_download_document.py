@@ -24,7 +24,7 @@ class TestDownloadDocument:
                 mock_cache.find_by_doc_id.return_value = None  # No cache hit
 
                 with patch(
-                    "company_research_agent.tools.download_document.EDINETConfig"
+                    "company_research_agent.tools.download_document.get_edinet_config"
                 ) as mock_config_class:
                     mock_config_class.return_value = MagicMock()
 
@@ -127,7 +127,7 @@ class TestDownloadDocument:
                 mock_cache.find_by_doc_id.return_value = None
 
                 with patch(
-                    "company_research_agent.tools.download_document.EDINETConfig"
+                    "company_research_agent.tools.download_document.get_edinet_config"
                 ) as mock_config_class:
                     mock_config_class.return_value = MagicMock()
 
@@ -165,7 +165,7 @@ class TestDownloadDocument:
                 mock_cache.find_by_doc_id.return_value = None
 
                 with patch(
-                    "company_research_agent.tools.download_document.EDINETConfig"
+                    "company_research_agent.tools.download_document.get_edinet_config"
                 ) as mock_config_class:
                     mock_config_class.return_value = MagicMock()
 
@@ -56,7 +56,7 @@ class TestSearchDocuments:
         mock_service.search_documents = AsyncMock(return_value=[sample_document_metadata])
 
         with patch(
-            "company_research_agent.tools.search_documents.EDINETConfig"
+            "company_research_agent.tools.search_documents.get_edinet_config"
         ) as mock_config_class:
             mock_config_class.return_value = MagicMock()
 
@@ -91,7 +91,7 @@ class TestSearchDocuments:
         mock_service.search_documents = AsyncMock(return_value=[sample_document_metadata])
 
         with patch(
-            "company_research_agent.tools.search_documents.EDINETConfig"
+            "company_research_agent.tools.search_documents.get_edinet_config"
         ) as mock_config_class:
             mock_config_class.return_value = MagicMock()
 